@@ -0,0 +1,39 @@
+"""
+Shared startup for the API entry points
+Environment loading, path setup and a single import of the application
+"""
+import os
+import re
+import sys
+from functools import cache
+
+# apps/api, the directory that makes the ``src`` package importable
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# KEY=value assignments, one per line; comment lines never match
+ENV_LINE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)=(.*)$', re.M)
+
+
+def load_env_file(env_file):
+    """Load KEY=value pairs from a .env file into os.environ, if it exists"""
+    if os.path.exists(env_file):
+        with open(env_file, 'r') as f:
+            for key, value in ENV_LINE.findall(f.read()):
+                os.environ[key] = value.strip()
+
+
+def server_settings(default_port):
+    """Host, port and debug flag for the development server"""
+    port = int(os.getenv('PORT', default_port))
+    host = os.getenv('HOST', '0.0.0.0')
+    debug = os.getenv('FLASK_ENV') != 'production'
+    return host, port, debug
+
+
+@cache
+def get_app():
+    """Import the Flask app and its SocketIO server once per process"""
+    if API_DIR not in sys.path:
+        sys.path.insert(0, API_DIR)
+    from src.main import app, socketio
+    return app, socketio
@@ -1,6 +1,8 @@
 import os
 import sys
 import time
+import json
+from functools import lru_cache
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
@@ -30,12 +32,12 @@ from src.routes.comprehensive_monitoring import comprehensive_monitoring_bp
 from src.middleware.request_logging import init_request_logging
 from src.middleware.security import setup_security
 from src.utils.monitoring import setup_monitoring, setup_railway_monitoring
-from src.utils.json_encoder import CustomJSONEncoder
+from src.utils.json_encoder import ORJSONProvider
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 
-# Configure custom JSON encoder for proper serialization
-app.json_encoder = CustomJSONEncoder
+# Configure orjson-backed JSON provider with the custom encoder for proper serialization
+app.json = ORJSONProvider(app)
 
 # Configure CORS for Railway deployment
 cors_origins = os.getenv('CORS_ORIGINS', '*')
@@ -118,18 +120,22 @@ except Exception as e:
     print(f"❌ Database initialization failed: {e}")
     # Continue running even if database fails
 
+# Everything in the health payload except the timestamp is fixed at startup, so
+# it is serialized once and only the timestamp is appended per probe
+_HEALTH_PREFIX = json.dumps({
+    'status': 'healthy',
+    'service': 'crazy-gary-api',
+    'version': '1.0.0',
+    'environment': os.getenv('ENVIRONMENT', 'development'),
+    'railway_env': os.getenv('RAILWAY_ENVIRONMENT', 'not_set')
+})[:-1].encode('utf-8') + b', "timestamp": '
+
 # Health check endpoint
 @app.route('/health')
 def health_check():
     """Basic health check for Railway"""
-    return {
-        'status': 'healthy', 
-        'service': 'crazy-gary-api', 
-        'version': '1.0.0',
-        'environment': os.getenv('ENVIRONMENT', 'development'),
-        'railway_env': os.getenv('RAILWAY_ENVIRONMENT', 'not_set'),
-        'timestamp': time.time()
-    }
+    body = _HEALTH_PREFIX + repr(time.time()).encode('ascii') + b'}'
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/api/health')
 def api_health_check():
@@ -152,15 +158,19 @@ def readiness_check():
 def liveness_check():
     return {'status': 'alive'}
 
-# Serve static assets
+# Serve static assets; send_from_directory does the single existence check and
+# answers 404 itself, so no separate os.path.exists probe is made per asset
+ASSETS_DIR = os.path.join(app.static_folder, 'assets')
+
+# Vite content-hashes everything under assets/, so a given URL never changes
+ASSET_MAX_AGE = 31536000
+
 @app.route('/assets/<path:filename>')
 def serve_assets(filename):
-    static_folder_path = app.static_folder
-    if static_folder_path:
-        assets_path = os.path.join(static_folder_path, 'assets')
-        if os.path.exists(os.path.join(assets_path, filename)):
-            return send_from_directory(assets_path, filename)
-    return "Asset not found", 404
+    response = send_from_directory(ASSETS_DIR, filename, max_age=ASSET_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 # Serve API documentation website
 @app.route('/docs/website')
@@ -197,12 +207,20 @@ def serve_api_docs_index():
 # Serve favicon
 @app.route('/favicon.ico')
 def serve_favicon():
+    return send_from_directory(app.static_folder, 'favicon.ico')
+
+# The SPA build can appear after startup, so presence is re-checked at most
+# once per interval rather than on every navigation request
+FRONTEND_CHECK_INTERVAL = 15
+
+@lru_cache(maxsize=1)
+def _frontend_available(interval_bucket):
     static_folder_path = app.static_folder
-    if static_folder_path:
-        favicon_path = os.path.join(static_folder_path, 'favicon.ico')
-        if os.path.exists(favicon_path):
-            return send_from_directory(static_folder_path, 'favicon.ico')
-    return "Favicon not found", 404
+    return bool(static_folder_path) and os.path.isfile(os.path.join(static_folder_path, 'index.html'))
+
+def frontend_available():
+    """Whether a built frontend index.html is present in the static folder"""
+    return _frontend_available(int(time.monotonic() // FRONTEND_CHECK_INTERVAL))
 
 # Serve the frontend for all non-API routes
 @app.route('/')
@@ -213,11 +231,11 @@ def serve(path=''):
         return None  # This will let Flask continue to other routes
     
     # For all other routes (SPA routing), serve index.html
-    static_folder_path = app.static_folder
-    if static_folder_path:
-        index_path = os.path.join(static_folder_path, 'index.html')
-        if os.path.exists(index_path):
-            return send_from_directory(static_folder_path, 'index.html')
+    if frontend_available():
+        # index.html must be revalidated so new deploys pick up new asset hashes
+        response = send_from_directory(app.static_folder, 'index.html')
+        response.cache_control.no_cache = True
+        return response
     
     # Fallback API response if no frontend is available
     return {
@@ -9,11 +9,12 @@ import uuid
 import psutil
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterable, Tuple
 from dataclasses import asdict
 from flask import Flask
 import json
 
+from src.models.user import db
 from src.models.monitoring_models import (
     MonitoringMetric, SystemAlert, Incident, HealthCheck, SLAMetric,
     LogEntry, SyntheticCheck, SyntheticResult, AlertRule,
@@ -207,6 +208,26 @@ class MonitoringService:
         except Exception as e:
             logger.error(f"Failed to register health check for {service_name}: {str(e)}")
     
+    def register_health_checks(self, checks: Iterable[Tuple[str, str, Callable]]):
+        """Register several health checks given as (service_name, check_type, check_function)"""
+        try:
+            if not hasattr(self, '_health_checks'):
+                self._health_checks = {}
+            
+            registered = []
+            for service_name, check_type, check_function in checks:
+                self._health_checks[service_name] = {
+                    'function': check_function,
+                    'type': check_type,
+                    'metadata': {}
+                }
+                registered.append(service_name)
+            
+            logger.info(f"Health checks registered for services: {', '.join(registered)}")
+            
+        except Exception as e:
+            logger.error(f"Failed to register health checks: {str(e)}")
+    
     def run_health_checks(self):
         """Execute all registered health checks"""
         try:
@@ -696,6 +717,38 @@ class MonitoringService:
             logger.error(f"Failed to create alert rule: {str(e)}")
             return None
     
+    def create_alert_rules(self, rules: List[Dict[str, Any]]) -> List[str]:
+        """Create several alert rules with a single bulk INSERT
+        
+        Each item takes the keyword arguments of create_alert_rule.
+        """
+        try:
+            mappings = [
+                {
+                    'id': str(uuid.uuid4()),
+                    'name': rule['name'],
+                    'metric_name': rule['metric_name'],
+                    'condition': rule['condition'],
+                    'threshold': rule['threshold'],
+                    'severity': rule['severity'].value,
+                    'duration': rule.get('duration', 300),
+                    'notification_channels': list(rule.get('notification_channels') or []),
+                    'created_by': rule.get('created_by')
+                }
+                for rule in rules
+            ]
+            
+            db.session.bulk_insert_mappings(AlertRule, mappings)
+            db.session.commit()
+            
+            logger.info(f"Alert rules created: {len(mappings)}")
+            return [mapping['id'] for mapping in mappings]
+            
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to create alert rules: {str(e)}")
+            return []
+    
     def evaluate_alert_rules(self):
         """Evaluate all alert rules against current metrics"""
         try:
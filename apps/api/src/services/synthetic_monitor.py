@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from urllib.parse import urlparse
 import json
 
+from src.models.user import db
 from src.models.monitoring_models import SyntheticCheck, SyntheticResult
 
 logger = logging.getLogger(__name__)
@@ -79,6 +80,40 @@ class SyntheticMonitor:
             logger.error(f"Failed to create synthetic check: {str(e)}")
             return None
     
+    def create_checks(self, checks: List[Dict[str, Any]]) -> List[str]:
+        """Create several synthetic checks with a single bulk INSERT
+        
+        Each item takes the keyword arguments of create_check.
+        """
+        try:
+            mappings = [
+                {
+                    'id': str(uuid.uuid4()),
+                    'name': check['name'],
+                    'url': check['url'],
+                    'check_type': check.get('check_type', 'http'),
+                    'frequency': check.get('frequency', 300),
+                    'timeout': check.get('timeout', 30),
+                    'expected_status': check.get('expected_status', 200),
+                    'expected_content': check.get('expected_content'),
+                    'headers': check.get('headers') or self.default_headers,
+                    'authentication': check.get('authentication'),
+                    'status': 'active'
+                }
+                for check in checks
+            ]
+            
+            db.session.bulk_insert_mappings(SyntheticCheck, mappings)
+            db.session.commit()
+            
+            logger.info(f"Synthetic checks created: {len(mappings)}")
+            return [mapping['id'] for mapping in mappings]
+            
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to create synthetic checks: {str(e)}")
+            return []
+    
     async def run_check_async(self, check_id: str) -> SyntheticResultData:
         """Run a synthetic check asynchronously"""
         try:
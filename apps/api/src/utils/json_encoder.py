@@ -6,37 +6,64 @@ from enum import Enum
 from datetime import datetime, date
 from typing import Any
 from decimal import Decimal
-from dataclasses import is_dataclass, asdict
+from dataclasses import is_dataclass, fields
+from functools import lru_cache
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+@lru_cache(maxsize=256)
+def _emitter_for(cls: type):
+    """Build a dict emitter for plain objects of the given class"""
+    name = cls.__name__
+    return lambda o: {
+        '_type': name,
+        **{k: v for k, v in o.__dict__.items() if k[:1] != '_'}
+    }
+
+
+def _shallow_from_dc(obj: Any) -> dict:
+    """Shallow field dict for a dataclass; nested values are left to the encoder"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles various Python types for API responses"""
     
     def default(self, obj: Any) -> Any:
-        # Handle enum types
-        if isinstance(obj, Enum):
+        # Exact-type fast path for the most common payload types
+        cls = obj.__class__
+        if cls is datetime or cls is date:
+            return obj.isoformat()
+        elif cls is Decimal:
+            return float(obj)
+        
+        # Handle enum types (isinstance needed for IntEnum/StrEnum subclasses)
+        elif isinstance(obj, Enum):
             return obj.value
         
-        # Handle datetime and date objects
+        # Handle datetime/date subclasses
         elif isinstance(obj, (datetime, date)):
             return obj.isoformat()
         
-        # Handle Decimal types
+        # Handle Decimal subclasses
         elif isinstance(obj, Decimal):
             return float(obj)
         
         # Handle dataclasses
         elif is_dataclass(obj):
-            data = asdict(obj)
-            # Recursively process the dict to handle nested enums
-            return self._process_dataclass_dict(data)
+            # One level at a time; the encoder calls back for nested values
+            return self._process_dataclass_dict(_shallow_from_dc(obj))
         
         # Handle objects with __dict__ (custom classes)
         elif hasattr(obj, '__dict__'):
-            return {
-                '_type': obj.__class__.__name__,
-                **{k: v for k, v in obj.__dict__.items() 
-                   if not k.startswith('_')}
-            }
+            return _emitter_for(cls)(obj)
         
         # Handle objects with to_dict method
         elif hasattr(obj, 'to_dict'):
@@ -50,22 +77,83 @@ class CustomJSONEncoder(json.JSONEncoder):
         return super().default(obj)
     
     def _process_dataclass_dict(self, data: dict) -> dict:
-        """Recursively process a dataclass dict to handle enums and nested objects"""
+        """Convert enum fields and list items of a shallow dataclass dict"""
         result = {}
         for key, value in data.items():
             if isinstance(value, Enum):
                 result[key] = value.value
-            elif is_dataclass(value):
-                result[key] = self._process_dataclass_dict(asdict(value))
-            elif isinstance(value, list):
-                result[key] = [
-                    self._process_dataclass_dict(asdict(item)) if is_dataclass(item)
-                    else item.value if isinstance(item, Enum)
-                    else item
-                    for item in value
-                ]
-            elif isinstance(value, dict):
-                result[key] = self._process_dataclass_dict(value)
+            elif isinstance(value, list) and value:
+                result[key] = self._process_list(value)
             else:
                 result[key] = value
-        return result
\ No newline at end of file
+        return result
+    
+    @staticmethod
+    def _process_list(items: list) -> list:
+        """Convert a list whose items share the first item's type in one pass
+        
+        The converter is picked once from ``type(items[0])``; items of any
+        other type are left for the encoder to visit.
+        """
+        item_type = type(items[0])
+        if is_dataclass(item_type):
+            convert = _shallow_from_dc
+        elif issubclass(item_type, Enum):
+            convert = lambda item: item.value
+        else:
+            return items
+        return [convert(item) if type(item) is item_type else item for item in items]
+
+
+_encoder = CustomJSONEncoder()
+
+
+def _provider_default(obj: Any) -> Any:
+    """Flask's formats first (HTTP dates, Decimal and UUID as str, dataclasses),
+    then CustomJSONEncoder for the types Flask rejects, such as plain enums"""
+    # Dataclasses are walked shallowly instead of deep-copied by asdict
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _encoder.default(obj)
+    try:
+        return DefaultJSONProvider.default(obj)
+    except TypeError:
+        return _encoder.default(obj)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson when it is installed
+    
+    The wire format matches Flask's default provider: dates and datetimes
+    are passed through to ``default`` rather than written as ISO 8601 by
+    orjson, so they stay RFC 822 HTTP dates, and Decimal stays a string.
+    Calls with json.dumps options orjson has no equivalent for use the stdlib.
+    """
+    
+    default = staticmethod(_provider_default)
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        indent = kwargs.pop('indent', None)
+        separators = kwargs.pop('separators', None)
+        if (not ORJSON_AVAILABLE or kwargs or indent not in (None, 2)
+                or separators not in (None, (',', ':'))):
+            if indent is not None:
+                kwargs['indent'] = indent
+            if separators is not None:
+                kwargs['separators'] = separators
+            return super().dumps(obj, **kwargs)
+        
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder accepts
+            return super().dumps(obj, indent=indent, separators=separators)
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if ORJSON_AVAILABLE and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
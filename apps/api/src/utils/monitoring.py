@@ -7,12 +7,42 @@ import os
 import sys
 import json
 import time
+import queue
+import atexit
 import logging
+import logging.handlers
+import threading
 import traceback
 from functools import wraps
 from typing import Dict, Any, Optional
-from flask import request, g, current_app
+from flask import Response, request, g, current_app
 import psutil
+# Optional msgspec import with fallback to plain dict responses
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+# Process environment alias; values read from it are resolved once at setup
+_ENV = os.environ
+
+
+if MSGSPEC_AVAILABLE:
+    class DetailedHealthResponse(msgspec.Struct):
+        """Response body for /api/health/detailed"""
+        status: str
+        timestamp: float
+        version: str
+        environment: str
+        dependencies: Dict[str, str]
+        performance: Dict[str, Any]
+
+    _encode_json = msgspec.json.Encoder().encode
+else:
+    def _encode_json(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
 
 
 class PerformanceMonitor:
@@ -20,8 +50,20 @@ class PerformanceMonitor:
     
     def __init__(self):
         self.start_time = time.time()
-        self.request_count = 0
-        self.error_count = 0
+        # Plain totals guarded by one lock; reads have no side effects
+        self._counts_lock = threading.Lock()
+        self._request_count = 0
+        self._error_count = 0
+    
+    @property
+    def request_count(self) -> int:
+        """Total number of recorded requests"""
+        return self._request_count
+    
+    @property
+    def error_count(self) -> int:
+        """Total number of recorded errors"""
+        return self._error_count
         
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get system performance metrics"""
@@ -43,7 +85,7 @@ class PerformanceMonitor:
                     'total': disk.total,
                     'used': disk.used,
                     'free': disk.free,
-                    'percent': (disk.used / disk.total) * 100
+                    'percent': disk.percent
                 },
                 'requests_total': self.request_count,
                 'errors_total': self.error_count
@@ -54,11 +96,13 @@ class PerformanceMonitor:
     
     def record_request(self):
         """Record a request"""
-        self.request_count += 1
+        with self._counts_lock:
+            self._request_count += 1
     
     def record_error(self):
         """Record an error"""
-        self.error_count += 1
+        with self._counts_lock:
+            self._error_count += 1
 
 
 # Global performance monitor instance
@@ -114,13 +158,14 @@ class StructuredLogger:
     
     def __init__(self, app=None):
         self.app = app
+        self.listener = None
         if app is not None:
             self.init_app(app)
     
     def init_app(self, app):
         """Initialize structured logging"""
         # Configure logging format
-        log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+        log_level = _ENV.get('LOG_LEVEL', 'INFO').upper()
         
         # Create formatter for Railway logs
         formatter = logging.Formatter(
@@ -131,11 +176,18 @@ class StructuredLogger:
         root_logger = logging.getLogger()
         root_logger.setLevel(log_level)
         
-        # Add console handler for Railway
+        # Add console handler for Railway; request threads only enqueue
+        # records and a background listener thread writes them to stdout
         if not root_logger.handlers:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
+            log_queue = queue.SimpleQueue()
+            root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self.listener = logging.handlers.QueueListener(
+                log_queue, console_handler, respect_handler_level=True
+            )
+            self.listener.start()
+            atexit.register(self.listener.stop)
         
         # Set up application logger
         app.logger.setLevel(log_level)
@@ -179,66 +231,110 @@ def setup_monitoring(app):
     # Initialize structured logging
     StructuredLogger(app)
     
+    # Resolve health check dependencies once at startup
+    from sqlalchemy import text
+    from src.models.user import db
+    select_one = text('SELECT 1')
+    
+    env_name = _ENV.get('ENVIRONMENT', 'development')
+    railway_env = _ENV.get('RAILWAY_ENVIRONMENT')
+    is_production = env_name == 'production'
+    
+    redis_url = _ENV.get('REDIS_URL')
+    redis_client = None
+    redis_setup_error = None
+    if redis_url:
+        try:
+            import redis
+            redis_client = redis.from_url(redis_url, socket_timeout=1, health_check_interval=30)
+        except Exception as e:
+            redis_setup_error = str(e)
+    
+    huggingface_key = _ENV.get('HUGGINGFACE_API_KEY')
+    
+    # The metrics envelope is constant apart from timestamp and metrics, so
+    # encode the static prefix once and splice the dynamic values per request
+    metrics_prefix = _encode_json({
+        'status': 'healthy',
+        'environment': env_name,
+        'railway_environment': railway_env
+    })[:-1] + b',"timestamp":'
+    
     # Add performance monitoring endpoint
     @app.route('/api/metrics')
     @monitor_performance
     def metrics():
         """Get application metrics"""
-        return {
-            'status': 'healthy',
-            'timestamp': time.time(),
-            'environment': os.getenv('ENVIRONMENT', 'development'),
-            'railway_environment': os.getenv('RAILWAY_ENVIRONMENT'),
-            'metrics': performance_monitor.get_system_metrics()
-        }
+        body = b''.join((
+            metrics_prefix,
+            repr(time.time()).encode(),
+            b',"metrics":',
+            _encode_json(performance_monitor.get_system_metrics()),
+            b'}'
+        ))
+        return Response(body, mimetype='application/json')
     
     # Enhanced health check with detailed status
     @app.route('/api/health/detailed')
     @monitor_performance
     def detailed_health():
         """Detailed health check with dependency status"""
-        checks = {
-            'status': 'healthy',
-            'timestamp': time.time(),
-            'version': '1.0.0',
-            'environment': os.getenv('ENVIRONMENT', 'development'),
-            'dependencies': {}
-        }
+        status = 'healthy'
+        timestamp = time.time()
+        dependencies = {}
         
         # Check database connection
         try:
-            from src.models.user import db
             with app.app_context():
-                db.engine.execute('SELECT 1')
-            checks['dependencies']['database'] = 'healthy'
+                with db.engine.connect() as conn:
+                    conn.execute(select_one)
+            dependencies['database'] = 'healthy'
         except Exception as e:
-            checks['dependencies']['database'] = f'unhealthy: {str(e)}'
-            checks['status'] = 'degraded'
+            dependencies['database'] = f'unhealthy: {str(e)}'
+            status = 'degraded'
         
         # Check Redis connection if configured
-        redis_url = os.getenv('REDIS_URL')
         if redis_url:
             try:
-                import redis
-                r = redis.from_url(redis_url)
-                r.ping()
-                checks['dependencies']['redis'] = 'healthy'
+                if redis_client is None:
+                    raise RuntimeError(redis_setup_error)
+                redis_client.ping()
+                dependencies['redis'] = 'healthy'
             except Exception as e:
-                checks['dependencies']['redis'] = f'unhealthy: {str(e)}'
-                checks['status'] = 'degraded'
+                dependencies['redis'] = f'unhealthy: {str(e)}'
+                status = 'degraded'
         
         # Check external API endpoints
-        huggingface_key = os.getenv('HUGGINGFACE_API_KEY')
         if huggingface_key:
-            checks['dependencies']['huggingface'] = 'configured'
+            dependencies['huggingface'] = 'configured'
         else:
-            checks['dependencies']['huggingface'] = 'not_configured'
+            dependencies['huggingface'] = 'not_configured'
         
         # Add performance metrics
-        checks['performance'] = performance_monitor.get_system_metrics()
+        performance = performance_monitor.get_system_metrics()
         
-        status_code = 200 if checks['status'] == 'healthy' else 503
-        return checks, status_code
+        status_code = 200 if status == 'healthy' else 503
+        if MSGSPEC_AVAILABLE:
+            return Response(
+                _encode_json(DetailedHealthResponse(
+                    status=status,
+                    timestamp=timestamp,
+                    version='1.0.0',
+                    environment=env_name,
+                    dependencies=dependencies,
+                    performance=performance
+                )),
+                status=status_code,
+                mimetype='application/json'
+            )
+        return {
+            'status': status,
+            'timestamp': timestamp,
+            'version': '1.0.0',
+            'environment': env_name,
+            'dependencies': dependencies,
+            'performance': performance
+        }, status_code
     
     # Error tracking
     @app.errorhandler(Exception)
@@ -260,7 +356,7 @@ def setup_monitoring(app):
         )
         
         # Return different error responses based on environment
-        if os.getenv('ENVIRONMENT') == 'production':
+        if is_production:
             return {
                 'error': 'Internal server error',
                 'message': 'An unexpected error occurred',
@@ -280,10 +376,10 @@ def setup_railway_monitoring():
     """Setup Railway-specific monitoring and alerting"""
     # Environment variables for monitoring
     monitoring_config = {
-        'railway_env': os.getenv('RAILWAY_ENVIRONMENT'),
-        'project_id': os.getenv('RAILWAY_PROJECT_ID'),
-        'service_id': os.getenv('RAILWAY_SERVICE_ID'),
-        'deployment_id': os.getenv('RAILWAY_DEPLOYMENT_ID')
+        'railway_env': _ENV.get('RAILWAY_ENVIRONMENT'),
+        'project_id': _ENV.get('RAILWAY_PROJECT_ID'),
+        'service_id': _ENV.get('RAILWAY_SERVICE_ID'),
+        'deployment_id': _ENV.get('RAILWAY_DEPLOYMENT_ID')
     }
     
     # Log Railway deployment information
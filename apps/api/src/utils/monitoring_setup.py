@@ -2,21 +2,156 @@
 Monitoring System Setup and Initialization
 Initializes all monitoring components and services
 """
+import os
+import sys
 import logging
 import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import psutil
+import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from flask import Flask
+from functools import lru_cache
 from typing import Dict, List, Any
+from sqlalchemy import text, select, delete
 
 # Import all monitoring components
 from src.services.monitoring_service import get_monitoring_service, AlertSeverity
 from src.services.infrastructure_monitor import get_infrastructure_monitor
 from src.services.synthetic_monitor import get_synthetic_monitor
 from src.services.external_integrations import get_external_integration_manager
-from src.models.monitoring_models import AlertRule, SyntheticCheck, HealthCheck
+from src.models.monitoring_models import (
+    MonitoringMetric, SystemAlert, Incident, HealthCheck,
+    SLAMetric, LogEntry, SyntheticCheck, SyntheticResult,
+    AlertRule
+)
+from src.models.user import db
+# Optional uvloop import (not available on Windows) with fallback
+try:
+    if sys.platform == 'win32':
+        raise ImportError('uvloop does not support Windows')
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+# Optional gevent import; production gunicorn workers run monkey-patched
+try:
+    import gevent
+    from gevent import monkey as gevent_monkey
+    GEVENT_AVAILABLE = True
+except ImportError:
+    gevent = None
+    gevent_monkey = None
+    GEVENT_AVAILABLE = False
+# Optional redis import with fallback
+try:
+    from src.models.redis_client import redis_client
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_client = None
+    REDIS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Connectivity probe for the database health check, built once
+_PING = text('SELECT 1')
+
+# Options shared by background jobs: merge missed runs, never overlap a job
+# with itself, and re-register idempotently on restart
+BACKGROUND_JOB_OPTIONS = {
+    'coalesce': True,
+    'max_instances': 1,
+    'misfire_grace_time': 30,
+    'replace_existing': True
+}
+
+# How long a computed setup status is reused for rapid polls
+SETUP_STATUS_TTL_SECONDS = 1.0
+
+# Rows removed per DELETE statement when purging expired monitoring data
+CLEANUP_CHUNK_SIZE = 10000
+
+# Default alert rules created at startup; keyword arguments for create_alert_rule
+_DEFAULT_ALERT_RULES = (
+    # CPU Usage Alert
+    {
+        'name': "High CPU Usage",
+        'metric_name': "system.cpu.usage",
+        'condition': "greater_than",
+        'threshold': 80.0,
+        'severity': AlertSeverity.HIGH,
+        'duration': 300,  # 5 minutes
+        'notification_channels': ("slack", "email"),
+        'created_by': "system"
+    },
+    # Memory Usage Alert
+    {
+        'name': "High Memory Usage",
+        'metric_name': "system.memory.usage",
+        'condition': "greater_than",
+        'threshold': 85.0,
+        'severity': AlertSeverity.HIGH,
+        'duration': 300,
+        'notification_channels': ("slack", "email"),
+        'created_by': "system"
+    },
+    # Disk Usage Alert
+    {
+        'name': "High Disk Usage",
+        'metric_name': "system.disk.usage",
+        'condition': "greater_than",
+        'threshold': 90.0,
+        'severity': AlertSeverity.CRITICAL,
+        'duration': 120,  # 2 minutes
+        'notification_channels': ("slack", "email", "pagerduty"),
+        'created_by': "system"
+    },
+    # Error Rate Alert
+    {
+        'name': "High Error Rate",
+        'metric_name': "http.error_rate",
+        'condition': "greater_than",
+        'threshold': 5.0,
+        'severity': AlertSeverity.MEDIUM,
+        'duration': 180,  # 3 minutes
+        'notification_channels': ("slack",),
+        'created_by': "system"
+    },
+    # Response Time Alert
+    {
+        'name': "High Response Time",
+        'metric_name': "http.response_time",
+        'condition': "greater_than",
+        'threshold': 1000.0,  # 1 second
+        'severity': AlertSeverity.MEDIUM,
+        'duration': 300,
+        'notification_channels': ("slack",),
+        'created_by': "system"
+    }
+)
+
+# Default health checks: (service name, check type, initializer method)
+_DEFAULT_HEALTH_CHECKS = (
+    ('database', 'database', '_check_database_health'),
+    ('redis', 'cache', '_check_redis_health'),
+    ('external_api', 'external_api', '_check_external_api_health'),
+    ('filesystem', 'filesystem', '_check_filesystem_health'),
+)
+
+# Disk usage changes slowly; health checks share one reading per window
+DISK_USAGE_TTL_SECONDS = 30
+
+
+@lru_cache(maxsize=1)
+def _disk_usage_cached(bucket: int):
+    """psutil.disk_usage('/') memoized per TTL bucket"""
+    return psutil.disk_usage('/')
+
+
 class MonitoringSystemInitializer:
     """Initializes and configures the complete monitoring system"""
     
@@ -24,20 +159,115 @@ class MonitoringSystemInitializer:
         self.app = app
         self.initialized = False
         
+        # Monitoring service references, bound once in initialize()
+        self.monitoring_service = None
+        self.infrastructure_monitor = None
+        self.synthetic_monitor = None
+        self.external_manager = None
+        self._models_ok = False
+        self._scheduler_started = False
+        
+        # (monotonic timestamp, payload) of the last get_setup_status result
+        self._status_cache = None
+        
+        # Keep-alive session reused by the external API health check
+        self._ext_session = requests.Session()
+        self._ext_session.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+        
+        # Under gevent a thread is a greenlet on the hub: a loop spinning in it
+        # would block every request and register a running loop on the OS
+        # thread, breaking run_until_complete elsewhere. Coroutines then run
+        # to completion in the hub's native threadpool instead
+        self._gevent = GEVENT_AVAILABLE and gevent_monkey.is_module_patched('threading')
+        self._loop = None
+        if not self._gevent:
+            # Long-lived event loop for async monitoring work; scheduler threads
+            # submit coroutines to it instead of creating a loop per job
+            self._loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            if hasattr(asyncio, 'eager_task_factory'):
+                # Python 3.12+: coroutines that finish without yielding run inline
+                self._loop.set_task_factory(asyncio.eager_task_factory)
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name='monitoring-event-loop',
+                daemon=True
+            )
+            self._loop_thread.start()
+    
+    def _ensure_scheduler(self):
+        """Create and start the app scheduler once; repeated calls are no-ops"""
+        if self._scheduler_started:
+            return
+        
+        if getattr(self.app, 'scheduler', None) is None:
+            if self._gevent:
+                # Jobs run as greenlets; coroutine jobs go through _async_job
+                from apscheduler.schedulers.gevent import GeventScheduler
+                self.app.scheduler = GeventScheduler()
+            else:
+                # APScheduler on the monitoring loop: coroutine jobs run on the
+                # loop, plain functions in its executor
+                from apscheduler.schedulers.asyncio import AsyncIOScheduler
+                self.app.scheduler = AsyncIOScheduler(event_loop=self._loop)
+            self.app.scheduler.start()
+        self._scheduler_started = True
+    
+    def _run_async(self, coro):
+        """Schedule a coroutine on the monitoring event loop, or a native thread under gevent"""
+        if self._gevent:
+            return gevent.get_hub().threadpool.spawn(asyncio.run, coro)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    def _async_job(self, coro_func):
+        """Scheduler job for a coroutine function
+
+        The asyncio scheduler awaits coroutine jobs itself; greenlet jobs
+        wait for a private loop in a native thread without blocking the hub.
+        """
+        if not self._gevent:
+            return coro_func
+        
+        def job():
+            return gevent.get_hub().threadpool.apply(asyncio.run, (coro_func(),))
+        job.__name__ = coro_func.__name__
+        return job
+        
     def initialize(self, app: Flask):
         """Initialize the complete monitoring system"""
         try:
             self.app = app
+            self._status_cache = None
             
-            # Initialize core monitoring services
-            self._initialize_monitoring_service()
-            self._initialize_infrastructure_monitor()
-            self._initialize_synthetic_monitor()
-            self._initialize_external_integrations()
+            # Resolve service singletons once for reuse across this class
+            self.monitoring_service = get_monitoring_service()
+            self.infrastructure_monitor = get_infrastructure_monitor()
+            self.synthetic_monitor = get_synthetic_monitor()
+            self.external_manager = get_external_integration_manager()
             
             # Setup database models
             self._setup_database_models()
             
+            # Services register their own jobs during initialization
+            self._ensure_scheduler()
+            
+            # Initialize core monitoring services concurrently; startup
+            # then costs the slowest initializer rather than their sum
+            initializers = {
+                'monitoring_service': self._initialize_monitoring_service,
+                'infrastructure_monitor': self._initialize_infrastructure_monitor,
+                'synthetic_monitor': self._initialize_synthetic_monitor,
+                'external_integrations': self._initialize_external_integrations
+            }
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix='monitoring-init') as executor:
+                futures = [executor.submit(init) for init in initializers.values()]
+                for future in futures:
+                    future.result()
+            components = list(initializers)
+            logger.info(
+                f"✅ Monitoring components initialized: {', '.join(components)}",
+                extra={'components': components}
+            )
+            
             # Create default monitoring configurations
             self._create_default_alert_rules()
             self._create_default_synthetic_checks()
@@ -47,9 +277,10 @@ class MonitoringSystemInitializer:
             self._start_background_tasks()
             
             # Send startup notifications
-            asyncio.create_task(self._send_startup_notifications())
+            self._run_async(self._send_startup_notifications())
             
             self.initialized = True
+            self._status_cache = None
             logger.info("✅ Monitoring system initialized successfully")
             
         except Exception as e:
@@ -59,9 +290,7 @@ class MonitoringSystemInitializer:
     def _initialize_monitoring_service(self):
         """Initialize the core monitoring service"""
         try:
-            monitoring_service = get_monitoring_service()
-            monitoring_service.initialize(self.app)
-            logger.info("✅ Monitoring service initialized")
+            self.monitoring_service.initialize(self.app)
         except Exception as e:
             logger.error(f"Failed to initialize monitoring service: {str(e)}")
             raise
@@ -69,9 +298,7 @@ class MonitoringSystemInitializer:
     def _initialize_infrastructure_monitor(self):
         """Initialize infrastructure monitoring"""
         try:
-            infrastructure_monitor = get_infrastructure_monitor()
-            infrastructure_monitor.initialize(self.app)
-            logger.info("✅ Infrastructure monitor initialized")
+            self.infrastructure_monitor.initialize(self.app)
         except Exception as e:
             logger.error(f"Failed to initialize infrastructure monitor: {str(e)}")
             raise
@@ -79,9 +306,7 @@ class MonitoringSystemInitializer:
     def _initialize_synthetic_monitor(self):
         """Initialize synthetic monitoring"""
         try:
-            synthetic_monitor = get_synthetic_monitor()
-            synthetic_monitor.initialize()
-            logger.info("✅ Synthetic monitor initialized")
+            self.synthetic_monitor.initialize()
         except Exception as e:
             logger.error(f"Failed to initialize synthetic monitor: {str(e)}")
             raise
@@ -89,9 +314,7 @@ class MonitoringSystemInitializer:
     def _initialize_external_integrations(self):
         """Initialize external integrations"""
         try:
-            external_manager = get_external_integration_manager()
-            external_manager.initialize(self.app)
-            logger.info("✅ External integrations initialized")
+            self.external_manager.initialize(self.app)
         except Exception as e:
             logger.error(f"Failed to initialize external integrations: {str(e)}")
             raise
@@ -99,18 +322,16 @@ class MonitoringSystemInitializer:
     def _setup_database_models(self):
         """Setup and migrate database models"""
         try:
-            # Import all models to ensure they're registered
-            from src.models.monitoring_models import (
-                MonitoringMetric, SystemAlert, Incident, HealthCheck,
-                SLAMetric, LogEntry, SyntheticCheck, SyntheticResult,
-                AlertRule
-            )
+            # Monitoring models are registered by the module-level import.
+            # Tables are created at app startup / by migrations; only run
+            # create_all here when explicitly requested
+            if os.environ.get('MONITORING_AUTO_CREATE') == '1':
+                with self.app.app_context():
+                    db.create_all()
+            else:
+                logger.debug("Skipping monitoring create_all; relying on app startup and migrations")
             
-            # Create all tables
-            with self.app.app_context():
-                from src.models.user import db
-                db.create_all()
-                
+            self._models_ok = True
             logger.info("✅ Database models setup completed")
             
         except Exception as e:
@@ -120,69 +341,11 @@ class MonitoringSystemInitializer:
     def _create_default_alert_rules(self):
         """Create default alert rules"""
         try:
-            monitoring_service = get_monitoring_service()
-            
-            # CPU Usage Alert
-            cpu_rule_id = monitoring_service.create_alert_rule(
-                name="High CPU Usage",
-                metric_name="system.cpu.usage",
-                condition="greater_than",
-                threshold=80.0,
-                severity=AlertSeverity.HIGH,
-                duration=300,  # 5 minutes
-                notification_channels=["slack", "email"],
-                created_by="system"
-            )
-            
-            # Memory Usage Alert
-            memory_rule_id = monitoring_service.create_alert_rule(
-                name="High Memory Usage",
-                metric_name="system.memory.usage",
-                condition="greater_than",
-                threshold=85.0,
-                severity=AlertSeverity.HIGH,
-                duration=300,
-                notification_channels=["slack", "email"],
-                created_by="system"
-            )
-            
-            # Disk Usage Alert
-            disk_rule_id = monitoring_service.create_alert_rule(
-                name="High Disk Usage",
-                metric_name="system.disk.usage",
-                condition="greater_than",
-                threshold=90.0,
-                severity=AlertSeverity.CRITICAL,
-                duration=120,  # 2 minutes
-                notification_channels=["slack", "email", "pagerduty"],
-                created_by="system"
-            )
-            
-            # Error Rate Alert
-            error_rule_id = monitoring_service.create_alert_rule(
-                name="High Error Rate",
-                metric_name="http.error_rate",
-                condition="greater_than",
-                threshold=5.0,
-                severity=AlertSeverity.MEDIUM,
-                duration=180,  # 3 minutes
-                notification_channels=["slack"],
-                created_by="system"
-            )
-            
-            # Response Time Alert
-            response_rule_id = monitoring_service.create_alert_rule(
-                name="High Response Time",
-                metric_name="http.response_time",
-                condition="greater_than",
-                threshold=1000.0,  # 1 second
-                severity=AlertSeverity.MEDIUM,
-                duration=300,
-                notification_channels=["slack"],
-                created_by="system"
-            )
+            # Insert all rules in one transaction
+            with self.app.app_context():
+                rule_ids = self.monitoring_service.create_alert_rules(_DEFAULT_ALERT_RULES)
             
-            logger.info(f"✅ Created default alert rules: CPU({cpu_rule_id}), Memory({memory_rule_id}), Disk({disk_rule_id}), Error({error_rule_id}), Response({response_rule_id})")
+            logger.info(f"✅ Created default alert rules: {', '.join(rule_ids)}")
             
         except Exception as e:
             logger.error(f"Failed to create default alert rules: {str(e)}")
@@ -190,40 +353,42 @@ class MonitoringSystemInitializer:
     def _create_default_synthetic_checks(self):
         """Create default synthetic monitoring checks"""
         try:
-            synthetic_monitor = get_synthetic_monitor()
-            
-            # Health check for the application itself
-            app_health_id = synthetic_monitor.create_check(
-                name="Application Health",
-                url="https://localhost:8080/health",
-                check_type="http",
-                frequency=300,  # 5 minutes
-                timeout=30,
-                expected_status=200,
-                expected_content="healthy"
-            )
-            
-            # API health check
-            api_health_id = synthetic_monitor.create_check(
-                name="API Health",
-                url="https://localhost:8080/api/health",
-                check_type="http",
-                frequency=300,
-                timeout=30,
-                expected_status=200
-            )
+            default_checks = [
+                # Health check for the application itself
+                {
+                    'name': "Application Health",
+                    'url': "https://localhost:8080/health",
+                    'check_type': "http",
+                    'frequency': 300,  # 5 minutes
+                    'timeout': 30,
+                    'expected_status': 200,
+                    'expected_content': "healthy"
+                },
+                # API health check
+                {
+                    'name': "API Health",
+                    'url': "https://localhost:8080/api/health",
+                    'check_type': "http",
+                    'frequency': 300,
+                    'timeout': 30,
+                    'expected_status': 200
+                },
+                # Homepage check
+                {
+                    'name': "Homepage Availability",
+                    'url': "https://localhost:8080/",
+                    'check_type': "http",
+                    'frequency': 600,  # 10 minutes
+                    'timeout': 30,
+                    'expected_status': 200
+                }
+            ]
             
-            # Homepage check
-            homepage_id = synthetic_monitor.create_check(
-                name="Homepage Availability",
-                url="https://localhost:8080/",
-                check_type="http",
-                frequency=600,  # 10 minutes
-                timeout=30,
-                expected_status=200
-            )
+            # Insert all checks in one transaction
+            with self.app.app_context():
+                check_ids = self.synthetic_monitor.create_checks(default_checks)
             
-            logger.info(f"✅ Created default synthetic checks: App Health({app_health_id}), API Health({api_health_id}), Homepage({homepage_id})")
+            logger.info(f"✅ Created default synthetic checks: {', '.join(check_ids)}")
             
         except Exception as e:
             logger.error(f"Failed to create default synthetic checks: {str(e)}")
@@ -231,34 +396,9 @@ class MonitoringSystemInitializer:
     def _register_default_health_checks(self):
         """Register default health checks"""
         try:
-            monitoring_service = get_monitoring_service()
-            
-            # Database health check
-            monitoring_service.register_health_check(
-                service_name="database",
-                check_type="database",
-                check_function=self._check_database_health
-            )
-            
-            # Redis health check (if available)
-            monitoring_service.register_health_check(
-                service_name="redis",
-                check_type="cache",
-                check_function=self._check_redis_health
-            )
-            
-            # External API health check
-            monitoring_service.register_health_check(
-                service_name="external_api",
-                check_type="external_api",
-                check_function=self._check_external_api_health
-            )
-            
-            # File system health check
-            monitoring_service.register_health_check(
-                service_name="filesystem",
-                check_type="filesystem",
-                check_function=self._check_filesystem_health
+            self.monitoring_service.register_health_checks(
+                (service_name, check_type, getattr(self, method_name))
+                for service_name, check_type, method_name in _DEFAULT_HEALTH_CHECKS
             )
             
             logger.info("✅ Registered default health checks")
@@ -269,10 +409,9 @@ class MonitoringSystemInitializer:
     def _check_database_health(self) -> Dict[str, Any]:
         """Check database health"""
         try:
-            from src.models.user import db
-            
             # Simple query to test database connectivity
-            result = db.session.execute('SELECT 1')
+            with self.app.app_context():
+                db.session.execute(_PING).scalar()
             
             return {
                 'status': 'healthy',
@@ -289,27 +428,23 @@ class MonitoringSystemInitializer:
     
     def _check_redis_health(self) -> Dict[str, Any]:
         """Check Redis health"""
+        if not REDIS_AVAILABLE:
+            return {
+                'status': 'unknown',
+                'message': 'Redis client not available',
+                'metadata': {'redis_client': 'not_installed'}
+            }
+        
         try:
-            # Try to import redis and check connection
-            try:
-                import redis
-                from src.models.redis_client import get_redis_client
-                
-                redis_client = get_redis_client()
-                redis_client.ping()
-                
-                return {
-                    'status': 'healthy',
-                    'message': 'Redis connection successful',
-                    'metadata': {'connection_test': 'passed'}
-                }
-                
-            except ImportError:
-                return {
-                    'status': 'unknown',
-                    'message': 'Redis client not available',
-                    'metadata': {'redis_client': 'not_installed'}
-                }
+            if redis_client.client is None:
+                raise ConnectionError('Redis client is not connected')
+            redis_client.client.ping()
+            
+            return {
+                'status': 'healthy',
+                'message': 'Redis connection successful',
+                'metadata': {'connection_test': 'passed'}
+            }
             
         except Exception as e:
             return {
@@ -321,10 +456,8 @@ class MonitoringSystemInitializer:
     def _check_external_api_health(self) -> Dict[str, Any]:
         """Check external API health"""
         try:
-            import requests
-            
             # Test external connectivity (e.g., Google DNS)
-            response = requests.get('http://8.8.8.8', timeout=5)
+            response = self._ext_session.get('http://8.8.8.8', timeout=5)
             
             return {
                 'status': 'healthy',
@@ -342,12 +475,9 @@ class MonitoringSystemInitializer:
     def _check_filesystem_health(self) -> Dict[str, Any]:
         """Check filesystem health"""
         try:
-            import os
-            import psutil
-            
             # Check disk space
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
+            disk = _disk_usage_cached(int(time.monotonic() // DISK_USAGE_TTL_SECONDS))
+            disk_percent = disk.percent
             
             if disk_percent > 95:
                 status = 'unhealthy'
@@ -382,34 +512,32 @@ class MonitoringSystemInitializer:
             if not self.app:
                 return
             
-            # Schedule regular tasks using Flask-APScheduler
+            self._ensure_scheduler()
+            
             with self.app.app_context():
-                # Ensure scheduler is available
-                if not hasattr(self.app, 'scheduler'):
-                    from apscheduler.schedulers.background import BackgroundScheduler
-                    self.app.scheduler = BackgroundScheduler()
-                    self.app.scheduler.start()
-                
                 # Add background monitoring tasks
                 self.app.scheduler.add_job(
-                    func=self._run_periodic_synthetic_checks,
+                    func=self._async_job(self._run_periodic_synthetic_checks),
                     trigger="interval",
                     seconds=600,  # Every 10 minutes
-                    id="periodic_synthetic_checks"
+                    id="periodic_synthetic_checks",
+                    **BACKGROUND_JOB_OPTIONS
                 )
                 
                 self.app.scheduler.add_job(
                     func=self._cleanup_old_data,
                     trigger="interval",
                     hours=24,  # Daily cleanup
-                    id="cleanup_old_data"
+                    id="cleanup_old_data",
+                    **BACKGROUND_JOB_OPTIONS
                 )
                 
                 self.app.scheduler.add_job(
-                    func=self._send_heartbeat,
+                    func=self._async_job(self._send_heartbeat),
                     trigger="interval",
                     minutes=5,  # Every 5 minutes
-                    id="send_heartbeat"
+                    id="send_heartbeat",
+                    **BACKGROUND_JOB_OPTIONS
                 )
             
             logger.info("✅ Background monitoring tasks started")
@@ -417,15 +545,10 @@ class MonitoringSystemInitializer:
         except Exception as e:
             logger.error(f"Failed to start background tasks: {str(e)}")
     
-    async def _send_startup_notifications(self):
-        """Send startup notifications to external systems"""
-        try:
-            external_manager = get_external_integration_manager()
-            await external_manager.send_heartbeat('monitoring-system', 'started')
-            
-            # Log startup event
-            monitoring_service = get_monitoring_service()
-            monitoring_service.log_entry(
+    def _log_startup_event(self):
+        """Record the startup event in the monitoring log store"""
+        with self.app.app_context():
+            self.monitoring_service.log_entry(
                 level='INFO',
                 source='monitoring_setup',
                 message='Monitoring system started successfully',
@@ -437,65 +560,74 @@ class MonitoringSystemInitializer:
                     'external_integrations'
                 ]}
             )
+    
+    async def _send_startup_notifications(self):
+        """Send startup notifications to external systems"""
+        try:
+            # Heartbeat and the (blocking, DB-backed) log entry run concurrently
+            await asyncio.gather(
+                self.external_manager.send_heartbeat('monitoring-system', 'started'),
+                asyncio.to_thread(self._log_startup_event)
+            )
             
             logger.info("✅ Startup notifications sent")
             
         except Exception as e:
             logger.error(f"Failed to send startup notifications: {str(e)}")
     
-    def _run_periodic_synthetic_checks(self):
+    async def _run_periodic_synthetic_checks(self):
         """Run periodic synthetic checks"""
         try:
-            synthetic_monitor = get_synthetic_monitor()
-            asyncio.run(synthetic_monitor.run_due_checks())
+            await self.synthetic_monitor.run_due_checks()
         except Exception as e:
             logger.error(f"Failed to run periodic synthetic checks: {str(e)}")
     
+    def _delete_in_chunks(self, model, cutoff_date: datetime) -> int:
+        """Delete rows older than cutoff_date in primary-key batches, committing each batch"""
+        # The batch is chosen by a subquery in the same statement, so no id
+        # list is bound as parameters (SQLite allows only 999 per statement)
+        batch = select(model.id).where(model.timestamp < cutoff_date).limit(CLEANUP_CHUNK_SIZE)
+        statement = delete(model).where(model.id.in_(batch))
+        
+        deleted = 0
+        while True:
+            result = db.session.execute(statement, execution_options={'synchronize_session': False})
+            db.session.commit()
+            if not result.rowcount:
+                return deleted
+            deleted += result.rowcount
+    
     def _cleanup_old_data(self):
         """Clean up old monitoring data"""
         try:
-            from src.models.monitoring_models import MonitoringMetric, LogEntry, SyntheticResult
-            
             cutoff_date = datetime.utcnow() - timedelta(days=30)  # Keep 30 days of data
             
             with self.app.app_context():
-                # Clean old metrics
-                deleted_metrics = MonitoringMetric.query.filter(
-                    MonitoringMetric.timestamp < cutoff_date
-                ).delete()
-                
-                # Clean old logs
-                deleted_logs = LogEntry.query.filter(
-                    LogEntry.timestamp < cutoff_date
-                ).delete()
-                
-                # Clean old synthetic results
-                deleted_results = SyntheticResult.query.filter(
-                    SyntheticResult.timestamp < cutoff_date
-                ).delete()
-                
-                # Commit changes
-                from src.models.user import db
-                db.session.commit()
+                try:
+                    # Short per-chunk transactions keep lock time and WAL
+                    # growth bounded on large tables
+                    deleted_metrics = self._delete_in_chunks(MonitoringMetric, cutoff_date)
+                    deleted_logs = self._delete_in_chunks(LogEntry, cutoff_date)
+                    deleted_results = self._delete_in_chunks(SyntheticResult, cutoff_date)
+                except Exception:
+                    db.session.rollback()
+                    raise
             
             logger.info(f"✅ Cleaned up old data: {deleted_metrics} metrics, {deleted_logs} logs, {deleted_results} results")
             
         except Exception as e:
             logger.error(f"Failed to cleanup old data: {str(e)}")
     
-    def _send_heartbeat(self):
+    async def _send_heartbeat(self):
         """Send heartbeat to monitoring systems"""
         try:
-            external_manager = get_external_integration_manager()
-            asyncio.run(external_manager.send_heartbeat('application', 'running'))
+            await self.external_manager.send_heartbeat('application', 'running')
         except Exception as e:
             logger.error(f"Failed to send heartbeat: {str(e)}")
     
     def create_user_journey_checks(self):
         """Create default user journey monitoring checks"""
         try:
-            synthetic_monitor = get_synthetic_monitor()
-            
             # Simple user journey: Homepage -> Login -> Dashboard
             login_journey_steps = [
                 {"action": "navigate", "url": "https://localhost:8080/", "wait": 2000},
@@ -503,7 +635,7 @@ class MonitoringSystemInitializer:
                 {"action": "wait", "duration": 1000}  # Wait for page load
             ]
             
-            journey_id = synthetic_monitor.create_user_journey_check(
+            journey_id = self.synthetic_monitor.create_user_journey_check(
                 name="User Login Flow",
                 steps=login_journey_steps,
                 frequency=900,  # 15 minutes
@@ -521,10 +653,8 @@ class MonitoringSystemInitializer:
             # This would typically be configured through the UI or configuration files
             # For now, we'll create some basic escalation rules in the alert rules
             
-            monitoring_service = get_monitoring_service()
-            
             # Create escalation for critical alerts
-            escalation_rule_id = monitoring_service.create_alert_rule(
+            escalation_rule_id = self.monitoring_service.create_alert_rule(
                 name="Critical Alert Escalation",
                 metric_name="*",  # Match all metrics
                 condition="greater_than",
@@ -542,66 +672,29 @@ class MonitoringSystemInitializer:
     
     def get_setup_status(self) -> Dict[str, Any]:
         """Get the status of the monitoring system setup"""
-        try:
-            status = {
-                'initialized': self.initialized,
-                'timestamp': datetime.utcnow().isoformat(),
-                'components': {
-                    'monitoring_service': False,
-                    'infrastructure_monitor': False,
-                    'synthetic_monitor': False,
-                    'external_integrations': False,
-                    'database_models': False,
-                    'background_tasks': False
-                }
-            }
-            
-            # Check component status
-            try:
-                get_monitoring_service()
-                status['components']['monitoring_service'] = True
-            except:
-                pass
-            
-            try:
-                get_infrastructure_monitor()
-                status['components']['infrastructure_monitor'] = True
-            except:
-                pass
-            
-            try:
-                get_synthetic_monitor()
-                status['components']['synthetic_monitor'] = True
-            except:
-                pass
-            
-            try:
-                get_external_integration_manager()
-                status['components']['external_integrations'] = True
-            except:
-                pass
-            
-            # Check database models
-            try:
-                from src.models.monitoring_models import MonitoringMetric
-                status['components']['database_models'] = True
-            except:
-                pass
-            
-            # Check background tasks
-            if self.app and hasattr(self.app, 'scheduler'):
-                status['components']['background_tasks'] = True
-            
-            status['overall_status'] = 'healthy' if all(status['components'].values()) else 'degraded'
-            
-            return status
-            
-        except Exception as e:
-            return {
-                'initialized': False,
-                'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
-            }
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached and now - cached[0] < SETUP_STATUS_TTL_SECONDS:
+            payload = cached[1]
+            return {**payload, 'components': dict(payload['components'])}
+        
+        components = {
+            'monitoring_service': self.monitoring_service is not None,
+            'infrastructure_monitor': self.infrastructure_monitor is not None,
+            'synthetic_monitor': self.synthetic_monitor is not None,
+            'external_integrations': self.external_manager is not None,
+            'database_models': self._models_ok,
+            'background_tasks': self._scheduler_started
+        }
+        
+        payload = {
+            'initialized': self.initialized,
+            'timestamp': datetime.utcnow().isoformat(),
+            'components': components,
+            'overall_status': 'healthy' if all(components.values()) else 'degraded'
+        }
+        self._status_cache = (now, payload)
+        return {**payload, 'components': dict(components)}
 
 # Global initializer instance
 monitoring_initializer = MonitoringSystemInitializer()
@@ -3,120 +3,435 @@ Security utilities for Flask API
 Provides authentication, authorization, and security middleware
 """
 
-import jwt
+import os
+import re
 import bcrypt
 import redis
 import time
+import hmac
+import json
+import base64
+import binascii
 import secrets
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from functools import wraps
-from typing import Dict, Any, Optional, List
+from functools import wraps, lru_cache
+from typing import Dict, Any, Optional, List, Union
 from flask import request, current_app, g
 from .error_handling import AuthenticationError, AuthorizationError, RateLimitError
 
-# Initialize Redis for rate limiting and caching (mock for now)
 try:
-    redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Optional gevent import; production gunicorn workers run monkey-patched
+try:
+    import gevent
+    from gevent import monkey as gevent_monkey
+    GEVENT_AVAILABLE = True
+except ImportError:
+    gevent = None
+    gevent_monkey = None
+    GEVENT_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _json_dumps(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Initialize Redis for rate limiting and caching (mock for now). A shared
+# blocking pool caps connections per process and reuses kept-alive sockets;
+# redis-py picks up the hiredis parser automatically when it is installed.
+try:
+    redis_client = redis.Redis(
+        connection_pool=redis.BlockingConnectionPool(
+            host='localhost',
+            port=6379,
+            db=0,
+            max_connections=64,
+            socket_keepalive=True,
+            health_check_interval=30,
+            decode_responses=True,
+        )
+    )
 except:
     redis_client = None
 
+# Key prefixes pre-encoded so redis-py sends them without re-encoding
+_BLACKLIST_PREFIX = b'blacklist:'
+_RATE_LIMIT_USER_PREFIX = b'rate_limit:user:'
+_RATE_LIMIT_IP_PREFIX = b'rate_limit:ip:'
+_LOGIN_ATTEMPTS_PREFIX = b'login_attempts:'
+
+# Atomic counter scripts: INCR and EXPIRE in one round-trip, no check/increment race
+_RATE_LIMIT_LUA = (
+    "local c = redis.call('INCR', KEYS[1]) "
+    "if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end "
+    "return c"
+)
+_LOGIN_ATTEMPT_LUA = (
+    "local c = redis.call('INCR', KEYS[1]) "
+    "redis.call('EXPIRE', KEYS[1], ARGV[1]) "
+    "return c"
+)
+
+if redis_client:
+    _rate_limit_script = redis_client.register_script(_RATE_LIMIT_LUA)
+    _login_attempt_script = redis_client.register_script(_LOGIN_ATTEMPT_LUA)
+else:
+    _rate_limit_script = None
+    _login_attempt_script = None
+
+# Verified JWT payloads keyed by a digest of the raw token. Entries live at
+# most TOKEN_CACHE_TTL seconds so revocations from other processes are
+# picked up quickly.
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_MAX_SIZE = 10000
+_token_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+
+def _get_cached_payload(cache_key: bytes) -> Optional[Dict[str, Any]]:
+    with _token_cache_lock:
+        entry = _token_cache.get(cache_key)
+        if entry is None:
+            return None
+        payload, valid_until = entry
+        if valid_until <= time.time():
+            del _token_cache[cache_key]
+            return None
+        _token_cache.move_to_end(cache_key)
+        return payload
+
+def _cache_payload(cache_key: bytes, payload: Dict[str, Any]) -> None:
+    valid_until = time.time() + TOKEN_CACHE_TTL
+    if isinstance(payload.get('exp'), (int, float)):
+        valid_until = min(payload['exp'], valid_until)
+    with _token_cache_lock:
+        _token_cache[cache_key] = (payload, valid_until)
+        _token_cache.move_to_end(cache_key)
+        if len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+
+def _evict_cached_jti(jti: str) -> None:
+    with _token_cache_lock:
+        stale = [k for k, (payload, _) in _token_cache.items() if payload.get('jti') == jti]
+        for cache_key in stale:
+            del _token_cache[cache_key]
+
+MAX_TOKEN_LENGTH = 4096
+# Three base64url segments, the signature possibly empty; matched in C by sre
+_TOKEN_STRUCTURE = re.compile(r'[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*')
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+@lru_cache(maxsize=4)
+def _hs256_base(key: str) -> hmac.HMAC:
+    """Keyed HMAC state; copied per signature so the key schedule runs once"""
+    return hmac.new(key.encode('utf-8'), digestmod=hashlib.sha256)
+
+def _sign_hs256(signing_input: bytes) -> bytes:
+    mac = _hs256_base(SecurityConfig.JWT_SECRET_KEY).copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+# The JOSE header never changes for HS256, so its encoded segment is built once
+_HS256_HEADER_B64 = _b64url_encode(_json_dumps({'alg': 'HS256', 'typ': 'JWT'}))
+
+def _encode_hs256(payload: Dict[str, Any]) -> str:
+    signing_input = _HS256_HEADER_B64 + b'.' + _b64url_encode(_json_dumps(payload))
+    signature_b64 = _b64url_encode(_sign_hs256(signing_input))
+    return (signing_input + b'.' + signature_b64).decode('ascii')
+
+def _peek_claims(token: str) -> Dict[str, Any]:
+    """Decode the payload segment without verifying the signature.
+
+    Only used to reject malformed, expired or revoked tokens before paying
+    for HMAC verification; the claims are never trusted on their own.
+    """
+    if len(token) > MAX_TOKEN_LENGTH or not _TOKEN_STRUCTURE.fullmatch(token):
+        raise AuthenticationError("Invalid token")
+    
+    try:
+        claims = _json_loads(_b64url_decode(token.split('.', 2)[1]))
+    except (binascii.Error, ValueError):
+        raise AuthenticationError("Invalid token")
+    
+    if not isinstance(claims, dict):
+        raise AuthenticationError("Invalid token")
+    return claims
+
+def _verify_hs256_signature(token: str) -> None:
+    """Check the header algorithm and HS256 signature of a structurally valid token"""
+    header_b64, payload_b64, signature_b64 = token.split('.')
+    
+    try:
+        header = _json_loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature_b64)
+        signing_input = f"{header_b64}.{payload_b64}".encode('ascii')
+    except (binascii.Error, ValueError):
+        raise AuthenticationError("Invalid token")
+    
+    if not isinstance(header, dict) or header.get('alg') != 'HS256':
+        raise AuthenticationError("Invalid token")
+    
+    if not hmac.compare_digest(_sign_hs256(signing_input), signature):
+        raise AuthenticationError("Invalid token")
+
 class SecurityConfig:
     """Security configuration"""
     JWT_SECRET_KEY = None
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    # Token lifetimes in whole seconds, kept in sync by init_security_config
+    JWT_ACCESS_TOKEN_SECONDS = 3600
+    JWT_REFRESH_TOKEN_SECONDS = 30 * 24 * 3600
     BCRYPT_ROUNDS = 12
     RATE_LIMIT_DEFAULT = 100  # requests per hour
     MAX_LOGIN_ATTEMPTS = 5
     LOCKOUT_DURATION = timedelta(minutes=15)
+    LOCKOUT_SECONDS = 15 * 60
+    ENABLE_VERIFY_CACHE = False  # skip bcrypt for recently verified credentials
 
 def generate_secure_token(length: int = 32) -> str:
     """Generate cryptographically secure random token"""
     return secrets.token_urlsafe(length)
 
+# Per-thread buffer of os.urandom output so hot paths needing a few random
+# bytes share one getrandom call. The pid is recorded so a forked worker
+# never reuses bytes inherited from its parent.
+RANDOM_BUFFER_SIZE = 4096
+_random_state = threading.local()
+
+def _random_bytes(n: int) -> bytes:
+    state = _random_state
+    pid = os.getpid()
+    
+    if getattr(state, 'pid', None) != pid or state.offset + n > len(state.buf):
+        state.buf = os.urandom(max(RANDOM_BUFFER_SIZE, n))
+        state.offset = 0
+        state.pid = pid
+    
+    chunk = state.buf[state.offset:state.offset + n]
+    state.offset += n
+    return chunk
+
+def _generate_jti() -> str:
+    """16 random bytes, base64url encoded like secrets.token_urlsafe(16)"""
+    return _b64url_encode(_random_bytes(16)).decode('ascii')
+
+def _run_bcrypt(func, *args):
+    """Run a bcrypt call without stalling the worker for its ~250ms
+    
+    bcrypt releases the GIL, so in threaded servers an inline call already
+    lets other requests run. Under gevent the call would block the hub, so
+    it goes to the hub's native threadpool and only this greenlet waits.
+    """
+    if GEVENT_AVAILABLE and gevent_monkey.is_module_patched('threading'):
+        return gevent.get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+# bcrypt's base64 variant: same bit packing as RFC 4648, different alphabet
+_BCRYPT_B64 = bytes.maketrans(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/',
+    b'./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789',
+)
+
+def _bcrypt_salt(rounds: int) -> bytes:
+    """Equivalent of bcrypt.gensalt drawing its 16 bytes from the shared buffer"""
+    encoded = base64.b64encode(_random_bytes(16)).translate(_BCRYPT_B64)[:22]
+    return b'$2b$%02d$' % rounds + encoded
+
+def _hash_password(password: str) -> str:
+    salt = _bcrypt_salt(SecurityConfig.BCRYPT_ROUNDS)
+    return _run_bcrypt(bcrypt.hashpw, password.encode('utf-8'), salt).decode('utf-8')
+
+def _verify_password(password: str, hashed: str) -> bool:
+    try:
+        return _run_bcrypt(bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8'))
+    except ValueError:
+        # Right shape but an invalid salt or cost
+        return False
+
 def hash_password(password: str) -> str:
     """Hash password using bcrypt"""
-    salt = bcrypt.gensalt(rounds=SecurityConfig.BCRYPT_ROUNDS)
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    return _hash_password(password)
+
+BCRYPT_HASH_LENGTH = 60
+_BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+
+# Successful verifications only, keyed by an HMAC under a per-process key so
+# neither the password nor a reusable digest of it is held in memory.
+# Failures are never cached to keep brute-force cost unchanged.
+VERIFY_CACHE_TTL = 30
+VERIFY_CACHE_MAX_SIZE = 2048
+_verify_cache_key = os.urandom(32)
+_verify_cache: "OrderedDict[bytes, float]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+def _credential_key(password: str, hashed: str) -> bytes:
+    message = password.encode('utf-8') + b'\0' + hashed.encode('utf-8')
+    return hmac.new(_verify_cache_key, message, hashlib.sha256).digest()
+
+def _recently_verified(cache_key: bytes) -> bool:
+    with _verify_cache_lock:
+        valid_until = _verify_cache.get(cache_key)
+        if valid_until is None:
+            return False
+        if valid_until <= time.monotonic():
+            del _verify_cache[cache_key]
+            return False
+        return True
+
+def _remember_verified(cache_key: bytes) -> None:
+    with _verify_cache_lock:
+        _verify_cache[cache_key] = time.monotonic() + VERIFY_CACHE_TTL
+        _verify_cache.move_to_end(cache_key)
+        if len(_verify_cache) > VERIFY_CACHE_MAX_SIZE:
+            _verify_cache.popitem(last=False)
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify password against hash"""
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    # Reject anything that is not a well-formed bcrypt hash before it can
+    # cost a key schedule
+    if len(hashed) != BCRYPT_HASH_LENGTH or not hashed.startswith(_BCRYPT_PREFIXES):
+        return False
+    
+    if not SecurityConfig.ENABLE_VERIFY_CACHE:
+        return _verify_password(password, hashed)
+    
+    cache_key = _credential_key(password, hashed)
+    if _recently_verified(cache_key):
+        return True
+    
+    verified = _verify_password(password, hashed)
+    if verified:
+        _remember_verified(cache_key)
+    return verified
 
 def generate_jwt_token(user_id: str, email: str, token_type: str = 'access') -> str:
     """Generate JWT token"""
     if not SecurityConfig.JWT_SECRET_KEY:
         raise ValueError("JWT_SECRET_KEY not configured")
     
-    expires_delta = (
-        SecurityConfig.JWT_ACCESS_TOKEN_EXPIRES 
-        if token_type == 'access' 
-        else SecurityConfig.JWT_REFRESH_TOKEN_EXPIRES
+    expires_in = (
+        SecurityConfig.JWT_ACCESS_TOKEN_SECONDS
+        if token_type == 'access'
+        else SecurityConfig.JWT_REFRESH_TOKEN_SECONDS
     )
+    now = int(time.time())
     
     payload = {
         'user_id': user_id,
         'email': email,
         'token_type': token_type,
-        'exp': datetime.utcnow() + expires_delta,
-        'iat': datetime.utcnow(),
-        'jti': generate_secure_token(16)  # JWT ID for token blacklisting
+        'exp': now + expires_in,
+        'iat': now,
+        'jti': _generate_jti()  # JWT ID for token blacklisting
     }
     
-    return jwt.encode(payload, SecurityConfig.JWT_SECRET_KEY, algorithm='HS256')
+    return _encode_hs256(payload)
 
 def verify_jwt_token(token: str) -> Dict[str, Any]:
     """Verify and decode JWT token"""
     if not SecurityConfig.JWT_SECRET_KEY:
         raise ValueError("JWT_SECRET_KEY not configured")
     
-    try:
-        payload = jwt.decode(token, SecurityConfig.JWT_SECRET_KEY, algorithms=['HS256'])
-        
-        # Check if token is blacklisted
-        if redis_client and redis_client.exists(f"blacklist:{payload['jti']}"):
-            raise AuthenticationError("Token has been revoked")
-        
-        return payload
+    cache_key = _token_cache_key(token)
+    cached = _get_cached_payload(cache_key)
+    if cached is not None:
+        return cached
     
-    except jwt.ExpiredSignatureError:
+    # Cheap rejections first: structure and expiry. exp is required so that
+    # every blacklist entry can expire with its token.
+    claims = _peek_claims(token)
+    exp = claims.get('exp')
+    if not isinstance(exp, (int, float)):
+        raise AuthenticationError("Invalid token")
+    if exp < time.time():
         raise AuthenticationError("Token has expired")
-    except jwt.InvalidTokenError:
+    
+    # Only signed claims reach Redis
+    _verify_hs256_signature(token)
+    
+    jti = claims.get('jti')
+    if jti is not None and not isinstance(jti, str):
         raise AuthenticationError("Invalid token")
+    if jti and redis_client and redis_client.exists(_BLACKLIST_PREFIX + jti.encode()):
+        raise AuthenticationError("Token has been revoked")
+    
+    _cache_payload(cache_key, claims)
+    return claims
 
-def blacklist_token(jti: str, expires_at: datetime = None):
-    """Add token to blacklist"""
+def blacklist_token(jti: str, expires_at: Union[int, datetime] = None):
+    """Add token to blacklist
+    
+    expires_at is the token's exp as epoch seconds; naive UTC datetimes are
+    still accepted.
+    """
+    _evict_cached_jti(jti)
+    
     if not redis_client:
         return
     
-    expires_at = expires_at or datetime.utcnow() + SecurityConfig.JWT_ACCESS_TOKEN_EXPIRES
-    ttl = int((expires_at - datetime.utcnow()).total_seconds())
+    if expires_at is None:
+        ttl = SecurityConfig.JWT_ACCESS_TOKEN_SECONDS
+    elif isinstance(expires_at, datetime):
+        ttl = int((expires_at - datetime.utcnow()).total_seconds())
+    else:
+        ttl = int(expires_at) - int(time.time())
     
     if ttl > 0:
-        redis_client.setex(f"blacklist:{jti}", ttl, "1")
+        redis_client.setex(_BLACKLIST_PREFIX + jti.encode(), ttl, "1")
+
+def revoke_jwt_token(token: str) -> None:
+    """Blacklist a valid token until its own expiry"""
+    payload = verify_jwt_token(token)
+    blacklist_token(payload['jti'], payload['exp'])
 
 def get_current_user() -> Optional[Dict[str, Any]]:
     """Get current authenticated user"""
     return getattr(g, 'current_user', None)
 
+_BEARER_PREFIX = 'Bearer '
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+def _bearer_token() -> str:
+    """Extract the bearer token from the Authorization header"""
+    auth_header = request.headers.get('Authorization')
+    
+    if not auth_header or auth_header[:_BEARER_PREFIX_LEN] != _BEARER_PREFIX:
+        raise AuthenticationError("Authorization header missing or invalid")
+    
+    return auth_header[_BEARER_PREFIX_LEN:].strip()
+
+def _set_current_user(payload: Dict[str, Any]) -> None:
+    """Store user info in Flask's g object"""
+    g.current_user = {
+        'id': payload['user_id'],
+        'email': payload['email'],
+        'token_type': payload.get('token_type', 'access')
+    }
+
 def require_auth(f):
     """Decorator to require authentication"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        auth_header = request.headers.get('Authorization')
-        
-        if not auth_header or not auth_header.startswith('Bearer '):
-            raise AuthenticationError("Authorization header missing or invalid")
-        
-        token = auth_header.split(' ')[1]
-        payload = verify_jwt_token(token)
-        
-        # Store user info in Flask's g object
-        g.current_user = {
-            'id': payload['user_id'],
-            'email': payload['email'],
-            'token_type': payload.get('token_type', 'access')
-        }
+        payload = verify_jwt_token(_bearer_token())
+        _set_current_user(payload)
         
         return f(*args, **kwargs)
     
@@ -124,14 +439,15 @@ def require_auth(f):
 
 def require_roles(required_roles: List[str]):
     """Decorator to require specific roles"""
+    required = frozenset(required_roles)
+    
     def decorator(f):
         @wraps(f)
         @require_auth
         def decorated_function(*args, **kwargs):
             user = get_current_user()
-            user_roles = user.get('roles', [])
             
-            if not any(role in user_roles for role in required_roles):
+            if required.isdisjoint(user.get('roles', ())):
                 raise AuthorizationError("Insufficient permissions")
             
             return f(*args, **kwargs)
@@ -139,6 +455,16 @@ def require_roles(required_roles: List[str]):
         return decorated_function
     return decorator
 
+def _rate_limit_key(key_func=None) -> Union[str, bytes]:
+    """Determine rate limit key"""
+    if key_func:
+        return key_func()
+    
+    user = get_current_user()
+    if user:
+        return _RATE_LIMIT_USER_PREFIX + str(user['id']).encode()
+    return _RATE_LIMIT_IP_PREFIX + str(request.remote_addr).encode()
+
 def rate_limit(max_requests: int = None, window: int = 3600, key_func=None):
     """Rate limiting decorator"""
     def decorator(f):
@@ -148,29 +474,15 @@ def rate_limit(max_requests: int = None, window: int = 3600, key_func=None):
                 # Skip rate limiting if Redis is not available
                 return f(*args, **kwargs)
             
-            # Determine rate limit key
-            if key_func:
-                key = key_func()
-            else:
-                user = get_current_user()
-                if user:
-                    key = f"rate_limit:user:{user['id']}"
-                else:
-                    key = f"rate_limit:ip:{request.remote_addr}"
+            key = _rate_limit_key(key_func)
             
-            # Check current request count
-            current_requests = redis_client.get(key)
+            # Increment and read the request count atomically
+            current_requests = _rate_limit_script(keys=[key], args=[window])
             max_reqs = max_requests or SecurityConfig.RATE_LIMIT_DEFAULT
             
-            if current_requests and int(current_requests) >= max_reqs:
+            if current_requests > max_reqs:
                 raise RateLimitError(f"Rate limit exceeded: {max_reqs} requests per hour")
             
-            # Increment request count
-            if current_requests:
-                redis_client.incr(key)
-            else:
-                redis_client.setex(key, window, 1)
-            
             return f(*args, **kwargs)
         
         return decorated_function
@@ -181,7 +493,7 @@ def check_login_attempts(identifier: str) -> None:
     if not redis_client:
         return
     
-    key = f"login_attempts:{identifier}"
+    key = _LOGIN_ATTEMPTS_PREFIX + identifier.encode()
     attempts = redis_client.get(key)
     
     if attempts and int(attempts) >= SecurityConfig.MAX_LOGIN_ATTEMPTS:
@@ -196,32 +508,25 @@ def record_login_attempt(identifier: str, success: bool) -> None:
     if not redis_client:
         return
     
-    key = f"login_attempts:{identifier}"
+    key = _LOGIN_ATTEMPTS_PREFIX + identifier.encode()
     
     if success:
         # Clear failed attempts on successful login
         redis_client.delete(key)
     else:
-        # Increment failed attempts
-        current_attempts = redis_client.get(key)
-        lockout_seconds = int(SecurityConfig.LOCKOUT_DURATION.total_seconds())
-        
-        if current_attempts:
-            redis_client.incr(key)
-            redis_client.expire(key, lockout_seconds)
-        else:
-            redis_client.setex(key, lockout_seconds, 1)
+        # Increment failed attempts and refresh the lockout window atomically
+        _login_attempt_script(keys=[key], args=[SecurityConfig.LOCKOUT_SECONDS])
+
+# Control characters other than tab, newline and carriage return map to None
+_SANITIZE_TABLE = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
 
 def sanitize_input(value: str, max_length: int = 255) -> str:
     """Sanitize user input"""
     if not isinstance(value, str):
         value = str(value)
     
-    # Remove null bytes and control characters
-    value = ''.join(char for char in value if ord(char) >= 32 or char in ['\n', '\r', '\t'])
-    
-    # Truncate to max length
-    return value[:max_length].strip()
+    # Remove null bytes and control characters, then truncate to max length
+    return value.translate(_SANITIZE_TABLE)[:max_length].strip()
 
 def validate_request_size(max_size: int = 1024 * 1024):  # 1MB default
     """Validate request content length"""
@@ -240,25 +545,22 @@ def validate_request_size(max_size: int = 1024 * 1024):  # 1MB default
 
 def cors_headers(origin: str = "*", methods: List[str] = None, headers: List[str] = None):
     """Add CORS headers"""
+    # Header values are fixed per decorated view, so build them once
+    allow_methods = ', '.join(methods or ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'])
+    allow_headers = ', '.join(headers or ['Content-Type', 'Authorization', 'X-Requested-With'])
+    
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             response = f(*args, **kwargs)
             
             # Handle both tuple and response object returns
-            if isinstance(response, tuple):
-                response_obj = response[0]
-            else:
-                response_obj = response
+            response_obj = response[0] if type(response) is tuple else response
             
             # Add CORS headers
             response_obj.headers['Access-Control-Allow-Origin'] = origin
-            response_obj.headers['Access-Control-Allow-Methods'] = ', '.join(
-                methods or ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS']
-            )
-            response_obj.headers['Access-Control-Allow-Headers'] = ', '.join(
-                headers or ['Content-Type', 'Authorization', 'X-Requested-With']
-            )
+            response_obj.headers['Access-Control-Allow-Methods'] = allow_methods
+            response_obj.headers['Access-Control-Allow-Headers'] = allow_headers
             response_obj.headers['Access-Control-Max-Age'] = '86400'  # 24 hours
             
             return response
@@ -280,9 +582,13 @@ def init_security_config(app):
     SecurityConfig.JWT_REFRESH_TOKEN_EXPIRES = timedelta(
         days=app.config.get('JWT_REFRESH_TOKEN_EXPIRES_DAYS', 30)
     )
+    SecurityConfig.JWT_ACCESS_TOKEN_SECONDS = int(SecurityConfig.JWT_ACCESS_TOKEN_EXPIRES.total_seconds())
+    SecurityConfig.JWT_REFRESH_TOKEN_SECONDS = int(SecurityConfig.JWT_REFRESH_TOKEN_EXPIRES.total_seconds())
     SecurityConfig.BCRYPT_ROUNDS = app.config.get('BCRYPT_ROUNDS', 12)
     SecurityConfig.RATE_LIMIT_DEFAULT = app.config.get('RATE_LIMIT_DEFAULT', 100)
     SecurityConfig.MAX_LOGIN_ATTEMPTS = app.config.get('MAX_LOGIN_ATTEMPTS', 5)
     SecurityConfig.LOCKOUT_DURATION = timedelta(
         minutes=app.config.get('LOCKOUT_DURATION_MINUTES', 15)
-    )
\ No newline at end of file
+    )
+    SecurityConfig.LOCKOUT_SECONDS = int(SecurityConfig.LOCKOUT_DURATION.total_seconds())
+    SecurityConfig.ENABLE_VERIFY_CACHE = app.config.get('ENABLE_VERIFY_CACHE', False)
\ No newline at end of file
@@ -5,14 +5,92 @@ Provides centralized security configuration, monitoring, and alerting
 """
 
 import os
+import sys
 import json
+import queue
+import atexit
+import time
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+import logging.handlers
+import ipaddress
+import hashlib
+import itertools
+import math
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Deque, Tuple, Callable
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from pathlib import Path
 from enum import Enum
 import yaml
 
+# libyaml-backed safe loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    requests = None
+    REQUESTS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a log payload, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+# Sliding windows for per-IP failure tracking, in seconds
+AUTH_FAILURE_WINDOW = 15 * 60
+RATE_LIMIT_HIT_WINDOW = 5 * 60
+
+# Distinct IPs tracked per window; the least recently seen are dropped first
+MAX_TRACKED_IPS = 10_000
+
+# Alerts retained in memory per monitor; the oldest are evicted first
+DEFAULT_MAX_ALERTS = 100_000
+
+# Webhook deliveries queued or in flight; alerts beyond this are dropped
+WEBHOOK_MAX_PENDING = 32
+
+# Security log writes are batched in a buffer of this size
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+class _BatchingFileHandler(logging.FileHandler):
+    """FileHandler with a large write buffer that is flushed once the log queue drains"""
+    
+    def __init__(self, filename: str, log_queue: queue.SimpleQueue):
+        self._log_queue = log_queue
+        super().__init__(filename)
+    
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+    
+    def flush(self):
+        # Under load records keep arriving and writes coalesce in the buffer
+        if self._log_queue.empty():
+            super().flush()
+
 
 class SecurityLevel(Enum):
     """Security level enumeration"""
@@ -30,7 +108,111 @@ class AlertSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+_SEVERITY_TO_LEVEL = {
+    AlertSeverity.INFO: logging.INFO,
+    AlertSeverity.WARNING: logging.WARNING,
+    AlertSeverity.ERROR: logging.ERROR,
+    AlertSeverity.CRITICAL: logging.CRITICAL
+}
+_SEVERITIES = tuple(AlertSeverity)
+
+
+class IPNetworkSet:
+    """Set of IPv4/IPv6 addresses and CIDR ranges with fast membership tests
+    
+    Networks are bucketed by prefix length as integer network addresses, so a
+    lookup is one mask-and-probe per distinct prefix length rather than a scan
+    over every configured entry.
+    """
+    
+    def __init__(self, entries: List[str]):
+        self._tables = {4: {}, 6: {}}
+        for entry in entries:
+            try:
+                network = ipaddress.ip_network(entry.strip(), strict=False)
+            except ValueError:
+                logging.warning(f"Ignoring invalid IP filter entry: {entry!r}")
+                continue
+            table = self._tables[network.version]
+            table.setdefault(network.prefixlen, set()).add(int(network.network_address))
+        
+        # (mask, networks) pairs, most specific prefix first
+        self._lookups = {}
+        for version, table in self._tables.items():
+            bits = 32 if version == 4 else 128
+            full = (1 << bits) - 1
+            self._lookups[version] = [
+                (full ^ ((1 << (bits - prefixlen)) - 1), networks)
+                for prefixlen, networks in sorted(table.items(), reverse=True)
+            ]
+    
+    def __contains__(self, ip: str) -> bool:
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        
+        value = int(address)
+        for mask, networks in self._lookups[address.version]:
+            if value & mask in networks:
+                return True
+        return False
+    
+    def __len__(self) -> int:
+        return sum(len(networks) for table in self._tables.values() for networks in table.values())
+
+
+class CardinalityEstimator:
+    """Distinct-value counter with bounded memory
+    
+    Counts exactly with a set up to ``exact_limit`` values, then folds them
+    into a HyperLogLog sketch of 2**precision one-byte registers (4 KiB and
+    roughly 1.6% standard error at the default precision of 12).
+    """
+    
+    def __init__(self, exact_limit: int = 10_000, precision: int = 12):
+        self.exact_limit = exact_limit
+        self.precision = precision
+        self._exact: Optional[set] = set()
+        self._registers: Optional[bytearray] = None
+    
+    def add(self, value: Any):
+        if self._exact is not None:
+            self._exact.add(value)
+            if len(self._exact) > self.exact_limit:
+                self._registers = bytearray(1 << self.precision)
+                for item in self._exact:
+                    self._add_to_sketch(item)
+                self._exact = None
+            return
+        self._add_to_sketch(value)
+    
+    def _add_to_sketch(self, value: Any):
+        digest = hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest()
+        hashed = int.from_bytes(digest, 'big')
+        rest_bits = 64 - self.precision
+        index = hashed >> rest_bits
+        rest = hashed & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+    
+    def __len__(self) -> int:
+        if self._exact is not None:
+            return len(self._exact)
+        
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self._registers)
+        
+        # Linear counting is more accurate while many registers are empty
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+@dataclass(slots=True)
 class SecurityConfig:
     """Security configuration data class"""
     # Rate limiting
@@ -66,6 +248,7 @@ class SecurityConfig:
     enable_performance_monitoring: bool = True
     log_retention_days: int = 30
     alert_webhook_url: str = ""
+    max_alerts: int = DEFAULT_MAX_ALERTS
     
     # IP filtering
     blocked_ips: List[str] = None
@@ -77,6 +260,9 @@ class SecurityConfig:
     enable_threat_detection: bool = True
     enable_audit_logging: bool = True
     
+    # Internal: cached IP matchers, excluded from serialization
+    _ip_filters: Dict[str, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize default values for list fields"""
         if self.allowed_content_types is None:
@@ -107,9 +293,30 @@ class SecurityConfig:
         if self.whitelist_ips is None:
             self.whitelist_ips = []
     
+    def _ip_filter(self, name: str) -> IPNetworkSet:
+        """Matcher for an IP list field, rebuilt when the list is replaced or resized"""
+        entries = getattr(self, name)
+        cached = self._ip_filters.get(name)
+        if cached is None or cached[0] is not entries or cached[1] != len(entries):
+            cached = (entries, len(entries), IPNetworkSet(entries))
+            self._ip_filters[name] = cached
+        return cached[2]
+    
+    def is_blocked(self, ip: str) -> bool:
+        """Check IP against blocked_ips, which may contain CIDR ranges"""
+        return bool(self.blocked_ips) and ip in self._ip_filter('blocked_ips')
+    
+    def is_whitelisted(self, ip: str) -> bool:
+        """Check IP against whitelist_ips, which may contain CIDR ranges"""
+        return bool(self.whitelist_ips) and ip in self._ip_filter('whitelist_ips')
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary
+        
+        Shallow: list values are the config's own lists, so treat the result
+        as read-only.
+        """
+        return {name: getattr(self, name) for name in _CONFIG_FIELD_NAMES}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SecurityConfig':
@@ -118,29 +325,54 @@ class SecurityConfig:
     
     def to_yaml(self) -> str:
         """Convert to YAML string"""
-        return yaml.dump(self.to_dict(), default_flow_style=False)
+        return yaml.dump(self.to_dict(), Dumper=YamlDumper, default_flow_style=False)
     
     @classmethod
-    def from_yaml(cls, yaml_str: str) -> 'SecurityConfig':
-        """Create from YAML string"""
-        data = yaml.safe_load(yaml_str)
+    def from_yaml(cls, yaml_str) -> 'SecurityConfig':
+        """Create from YAML string or UTF-8 bytes"""
+        data = yaml.load(yaml_str, Loader=YamlLoader)
         return cls.from_dict(data)
     
     def save_to_file(self, filepath: str):
         """Save configuration to file"""
-        with open(filepath, 'w') as f:
-            f.write(self.to_yaml())
+        Path(filepath).write_bytes(
+            yaml.dump(self.to_dict(), Dumper=YamlDumper, default_flow_style=False, encoding='utf-8')
+        )
     
     @classmethod
     def load_from_file(cls, filepath: str) -> 'SecurityConfig':
         """Load configuration from file"""
-        with open(filepath, 'r') as f:
-            yaml_str = f.read()
-        return cls.from_yaml(yaml_str)
+        # The YAML reader detects the encoding of bytes input itself
+        return cls.from_yaml(Path(filepath).read_bytes())
+
+
+# Public SecurityConfig fields, in declaration order
+_CONFIG_FIELD_NAMES = tuple(f.name for f in fields(SecurityConfig) if not f.name.startswith('_'))
+
+_EPOCH = datetime(1970, 1, 1)
 
 
 class SecurityAlert:
-    """Security alert data class"""
+    """Security alert data class
+    
+    The creation time is kept as integer nanoseconds since the epoch; the
+    naive UTC ``timestamp`` datetime is only built when something reads it.
+    """
+    
+    __slots__ = (
+        'id', 'alert_type', 'severity', 'message', 'details', 'source_ip',
+        'user_agent', 'timestamp_ns', '_timestamp', 'status'
+    )
+    
+    # Ids are a per-process prefix plus a counter; next() on itertools.count
+    # is atomic under the GIL
+    _id_prefix = f"alert_{os.getpid():x}_"
+    _id_counter = itertools.count()
+    
+    @classmethod
+    def _reset_ids_after_fork(cls):
+        cls._id_prefix = f"alert_{os.getpid():x}_"
+        cls._id_counter = itertools.count()
     
     def __init__(
         self,
@@ -152,16 +384,34 @@ class SecurityAlert:
         user_agent: str = None,
         timestamp: datetime = None
     ):
-        self.id = f"alert_{int(datetime.utcnow().timestamp() * 1000000)}"
-        self.alert_type = alert_type
+        if timestamp is None:
+            self.timestamp_ns = time.time_ns()
+            self._timestamp = None
+        else:
+            if timestamp.tzinfo is not None:
+                # Stored as naive UTC, like the timestamps built from timestamp_ns
+                timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+            self.timestamp_ns = (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+            self._timestamp = timestamp
+        
+        self.id = f"{SecurityAlert._id_prefix}{next(SecurityAlert._id_counter):x}"
+        # Alert types come from a small, fixed vocabulary, so share one
+        # string object per type
+        self.alert_type = sys.intern(alert_type)
         self.severity = severity
         self.message = message
         self.details = details or {}
         self.source_ip = source_ip
         self.user_agent = user_agent
-        self.timestamp = timestamp or datetime.utcnow()
         self.status = "active"
     
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a naive UTC datetime"""
+        if self._timestamp is None:
+            self._timestamp = _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
+        return self._timestamp
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -177,23 +427,56 @@ class SecurityAlert:
         }
 
 
+def _create_webhook_session():
+    """Keep-alive session shared by all monitors for webhook delivery"""
+    if not REQUESTS_AVAILABLE:
+        return None
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=SecurityAlert._reset_ids_after_fork)
+
+
 class SecurityMonitor:
     """Security monitoring and alerting system"""
     
+    # Webhooks are posted off the request path over pooled connections
+    _webhook_session = _create_webhook_session()
+    _webhook_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='webhook')
+    # The pool's queue is unbounded, so a slow endpoint could pile up alerts
+    _webhook_slots = threading.BoundedSemaphore(WEBHOOK_MAX_PENDING)
+    
     def __init__(self, config: SecurityConfig):
         self.config = config
-        self.alerts: List[SecurityAlert] = []
+        self.alerts: Deque[SecurityAlert] = deque(
+            maxlen=getattr(config, 'max_alerts', DEFAULT_MAX_ALERTS)
+        )
         self.metrics: Dict[str, Any] = {
             'requests_total': 0,
             'requests_blocked': 0,
             'auth_failures': 0,
             'rate_limit_hits': 0,
             'suspicious_requests': 0,
-            'unique_ips': set(),
+            'unique_ips': CardinalityEstimator(),
             'threat_score': 0,
+            'webhooks_dropped': 0,
             'start_time': datetime.utcnow()
         }
         
+        # Maintained by create_alert and resolve_alert so metrics never scan alerts
+        self._active_alert_count = 0
+        self._webhook_backlog_full = False
+        
+        # Per-IP monotonic timestamps of recent events, pruned on access and
+        # kept in least recently seen order so the index stays bounded
+        self._auth_failures_by_ip: "OrderedDict[str, deque]" = OrderedDict()
+        self._rate_limit_hits_by_ip: "OrderedDict[str, deque]" = OrderedDict()
+        
         # Setup logging
         self._setup_logging()
     
@@ -206,9 +489,12 @@ class SecurityMonitor:
         self.logger = logging.getLogger('security_monitor')
         self.logger.setLevel(logging.INFO)
         
+        # Records are queued on the hot path and written by a listener thread
+        log_queue = queue.SimpleQueue()
+        
         # Create file handler
         log_file = 'security_monitor.log'
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _BatchingFileHandler(log_file, log_queue)
         file_handler.setLevel(logging.INFO)
         
         # Create console handler
@@ -223,8 +509,12 @@ class SecurityMonitor:
         console_handler.setFormatter(formatter)
         
         # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
     
     def record_request(
         self,
@@ -239,14 +529,17 @@ class SecurityMonitor:
         self.metrics['requests_total'] += 1
         self.metrics['unique_ips'].add(source_ip)
         
+        if not blocked and self.is_ip_blocked(source_ip):
+            blocked = True
+        
         if blocked:
             self.metrics['requests_blocked'] += 1
         
         if suspicious:
             self.metrics['suspicious_requests'] += 1
         
-        # Log security events
-        if self.config.enable_security_logging:
+        # Log security events; skip building the payload if INFO is filtered
+        if self.config.enable_security_logging and self.logger.isEnabledFor(logging.INFO):
             event_data = {
                 'source_ip': source_ip,
                 'user_agent': user_agent,
@@ -255,7 +548,14 @@ class SecurityMonitor:
                 'blocked': blocked,
                 'suspicious': suspicious
             }
-            self.logger.info(f"Request recorded: {json.dumps(event_data)}")
+            self.logger.info("Request recorded: %s", _dumps(event_data))
+    
+    def is_ip_blocked(self, source_ip: str) -> bool:
+        """Check whether an IP is blocked and not whitelisted by the config"""
+        is_blocked = getattr(self.config, 'is_blocked', None)
+        if is_blocked is None or not is_blocked(source_ip):
+            return False
+        return not self.config.is_whitelisted(source_ip)
     
     def record_auth_failure(
         self,
@@ -267,7 +567,9 @@ class SecurityMonitor:
         self.metrics['auth_failures'] += 1
         
         # Create alert for multiple failures
-        recent_failures = self._get_recent_auth_failures(source_ip)
+        recent_failures = self._record_recent_event(
+            self._auth_failures_by_ip, source_ip, AUTH_FAILURE_WINDOW
+        )
         if recent_failures >= self.config.max_login_attempts:
             self.create_alert(
                 alert_type="BRUTE_FORCE_ATTEMPT",
@@ -292,7 +594,9 @@ class SecurityMonitor:
         self.metrics['rate_limit_hits'] += 1
         
         # Create alert for excessive rate limiting
-        recent_hits = self._get_recent_rate_limit_hits(source_ip)
+        recent_hits = self._record_recent_event(
+            self._rate_limit_hits_by_ip, source_ip, RATE_LIMIT_HIT_WINDOW
+        )
         if recent_hits >= 10:  # More than 10 hits in recent period
             self.create_alert(
                 alert_type="EXCESSIVE_RATE_LIMITING",
@@ -324,69 +628,124 @@ class SecurityMonitor:
             user_agent=user_agent
         )
         
+        # A full deque evicts its oldest alert on append
+        if len(self.alerts) == self.alerts.maxlen and self.alerts[0].status == 'active':
+            self._active_alert_count -= 1
         self.alerts.append(alert)
+        self._active_alert_count += 1
         
         # Log the alert
         if self.config.enable_security_logging:
-            log_level = {
-                AlertSeverity.INFO: logging.INFO,
-                AlertSeverity.WARNING: logging.WARNING,
-                AlertSeverity.ERROR: logging.ERROR,
-                AlertSeverity.CRITICAL: logging.CRITICAL
-            }[severity]
+            log_level = _SEVERITY_TO_LEVEL[severity]
             
-            self.logger.log(
-                log_level,
-                f"ALERT [{alert_type}]: {message} - {json.dumps(alert.to_dict())}"
-            )
+            if self.logger.isEnabledFor(log_level):
+                self.logger.log(
+                    log_level,
+                    "ALERT [%s]: %s - %s", alert_type, message, _dumps(alert.to_dict())
+                )
         
         # Send webhook alert if configured
         if self.config.alert_webhook_url:
             self._send_webhook_alert(alert)
     
+    def resolve_alert(self, alert_id: str) -> bool:
+        """Mark an active alert as resolved"""
+        for alert in self.alerts:
+            if alert.id == alert_id:
+                if alert.status != 'active':
+                    return False
+                alert.status = 'resolved'
+                self._active_alert_count -= 1
+                return True
+        return False
+    
     def _send_webhook_alert(self, alert: SecurityAlert):
-        """Send alert via webhook"""
+        """Send alert via webhook without blocking the caller"""
+        if self._webhook_session is None:
+            self.logger.error("Webhook alert failed: requests is not installed")
+            return
+        
+        if not self._webhook_slots.acquire(blocking=False):
+            self.metrics['webhooks_dropped'] += 1
+            # Warn once per backlog, not once per dropped alert
+            if not self._webhook_backlog_full:
+                self._webhook_backlog_full = True
+                self.logger.warning(
+                    f"Webhook backlog full ({WEBHOOK_MAX_PENDING} pending), dropping alerts"
+                )
+            return
+        self._webhook_backlog_full = False
+        
+        payload = {
+            'alert': alert.to_dict(),
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        
         try:
-            import requests
-            
-            payload = {
-                'alert': alert.to_dict(),
-                'timestamp': datetime.utcnow().isoformat()
-            }
-            
-            response = requests.post(
+            future = self._webhook_pool.submit(
+                self._webhook_session.post,
                 self.config.alert_webhook_url,
                 json=payload,
                 timeout=10
             )
-            
-            if response.status_code == 200:
-                self.logger.info(f"Alert sent via webhook: {alert.id}")
-            else:
-                self.logger.error(f"Failed to send webhook alert: {response.status_code}")
-        
+        except RuntimeError as e:  # pool shut down at interpreter exit
+            self._webhook_slots.release()
+            self.logger.error(f"Webhook alert failed: {e}")
+            return
+        future.add_done_callback(lambda f: self._log_webhook_result(f, alert.id))
+    
+    def _log_webhook_result(self, future: Future, alert_id: str):
+        """Log the outcome of a webhook delivery"""
+        self._webhook_slots.release()
+        try:
+            response = future.result()
         except Exception as e:
             self.logger.error(f"Webhook alert failed: {e}")
+            return
+        
+        if response.status_code == 200:
+            self.logger.info(f"Alert sent via webhook: {alert_id}")
+        else:
+            self.logger.error(f"Failed to send webhook alert: {response.status_code}")
+    
+    @staticmethod
+    def _prune_window(events: deque, window: float, now: float) -> int:
+        """Drop events older than the window and return how many remain"""
+        cutoff = now - window
+        while events and events[0] <= cutoff:
+            events.popleft()
+        return len(events)
+    
+    def _record_recent_event(self, index: "OrderedDict[str, deque]", source_ip: str, window: float) -> int:
+        """Record an event for IP and return its count within the window"""
+        now = time.monotonic()
+        events = index.get(source_ip)
+        if events is None:
+            events = index[source_ip] = deque()
+            if len(index) > MAX_TRACKED_IPS:
+                index.popitem(last=False)
+        else:
+            index.move_to_end(source_ip)
+        events.append(now)
+        return self._prune_window(events, window, now)
+    
+    def _count_recent_events(self, index: "OrderedDict[str, deque]", source_ip: str, window: float) -> int:
+        """Count an IP's events within the window, forgetting the IP once none remain"""
+        events = index.get(source_ip)
+        if events is None:
+            return 0
+        count = self._prune_window(events, window, time.monotonic())
+        if not count:
+            del index[source_ip]
+        return count
     
     def _get_recent_auth_failures(self, source_ip: str) -> int:
         """Get recent authentication failures for IP"""
-        cutoff_time = datetime.utcnow() - timedelta(minutes=15)
-        return len([
-            alert for alert in self.alerts
-            if (alert.alert_type == "AUTH_FAILURE" and
-                alert.source_ip == source_ip and
-                alert.timestamp > cutoff_time)
-        ])
+        return self._count_recent_events(self._auth_failures_by_ip, source_ip, AUTH_FAILURE_WINDOW)
     
     def _get_recent_rate_limit_hits(self, source_ip: str) -> int:
         """Get recent rate limit hits for IP"""
-        cutoff_time = datetime.utcnow() - timedelta(minutes=5)
-        return len([
-            alert for alert in self.alerts
-            if (alert.alert_type == "RATE_LIMIT_HIT" and
-                alert.source_ip == source_ip and
-                alert.timestamp > cutoff_time)
-        ])
+        return self._count_recent_events(self._rate_limit_hits_by_ip, source_ip, RATE_LIMIT_HIT_WINDOW)
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current security metrics"""
@@ -400,8 +759,9 @@ class SecurityMonitor:
             'rate_limit_hits': self.metrics['rate_limit_hits'],
             'suspicious_requests': self.metrics['suspicious_requests'],
             'unique_ips': len(self.metrics['unique_ips']),
-            'active_alerts': len([a for a in self.alerts if a.status == 'active']),
+            'active_alerts': self._active_alert_count,
             'total_alerts': len(self.alerts),
+            'webhooks_dropped': self.metrics['webhooks_dropped'],
             'threat_score': self._calculate_threat_score()
         }
     
@@ -413,32 +773,30 @@ class SecurityMonitor:
         score += min(self.metrics['requests_blocked'] * 2, 50)
         score += min(self.metrics['auth_failures'] * 3, 30)
         score += min(self.metrics['rate_limit_hits'], 20)
-        score += min(len([a for a in self.alerts if a.status == 'active']) * 5, 25)
+        score += min(self._active_alert_count * 5, 25)
         
         return min(score, 100)  # Cap at 100
     
     def get_security_report(self, hours: int = 24) -> Dict[str, Any]:
         """Generate security report for specified timeframe"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        
-        # Filter alerts for timeframe
-        recent_alerts = [
-            alert for alert in self.alerts
-            if alert.timestamp > cutoff_time
-        ]
-        
-        # Count alert types
-        alert_types = {}
-        for alert in recent_alerts:
-            alert_types[alert.alert_type] = alert_types.get(alert.alert_type, 0) + 1
-        
-        # Get top source IPs
-        ip_counts = {}
-        for alert in recent_alerts:
+        cutoff_ns = time.time_ns() - hours * 3600 * 1_000_000_000
+        
+        # Filter alerts for timeframe and count types, severities and
+        # source IPs in a single pass
+        recent_alerts = []
+        alert_types = Counter()
+        severity_counts = Counter()
+        ip_counts = Counter()
+        for alert in self.alerts:
+            if alert.timestamp_ns <= cutoff_ns:
+                continue
+            recent_alerts.append(alert)
+            alert_types[alert.alert_type] += 1
+            severity_counts[alert.severity] += 1
             if alert.source_ip:
-                ip_counts[alert.source_ip] = ip_counts.get(alert.source_ip, 0) + 1
+                ip_counts[alert.source_ip] += 1
         
-        top_ips = sorted(ip_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_ips = ip_counts.most_common(10)
         
         return {
             'report_period_hours': hours,
@@ -447,16 +805,14 @@ class SecurityMonitor:
                 'total_requests': self.metrics['requests_total'],
                 'blocked_requests': self.metrics['requests_blocked'],
                 'unique_ips': len(self.metrics['unique_ips']),
-                'active_alerts': len([a for a in self.alerts if a.status == 'active']),
+                'active_alerts': self._active_alert_count,
                 'threat_score': self._calculate_threat_score()
             },
             'alerts': {
                 'total': len(recent_alerts),
-                'by_type': alert_types,
+                'by_type': dict(alert_types),
                 'by_severity': {
-                    severity.value: len([
-                        a for a in recent_alerts if a.severity == severity
-                    ]) for severity in AlertSeverity
+                    severity.value: severity_counts[severity] for severity in _SEVERITIES
                 }
             },
             'top_source_ips': top_ips,
@@ -467,10 +823,16 @@ class SecurityMonitor:
         """Generate security recommendations based on alerts"""
         recommendations = []
         
-        # Analyze alert patterns
-        auth_failures = len([a for a in alerts if 'AUTH' in a.alert_type])
-        rate_limits = len([a for a in alerts if 'RATE_LIMIT' in a.alert_type])
-        suspicious = len([a for a in alerts if 'SUSPICIOUS' in a.alert_type])
+        # Analyze alert patterns in one pass
+        auth_failures = rate_limits = suspicious = 0
+        for alert in alerts:
+            alert_type = alert.alert_type
+            if 'AUTH' in alert_type:
+                auth_failures += 1
+            if 'RATE_LIMIT' in alert_type:
+                rate_limits += 1
+            if 'SUSPICIOUS' in alert_type:
+                suspicious += 1
         
         if auth_failures > 10:
             recommendations.append("Consider implementing CAPTCHA after multiple auth failures")
@@ -496,6 +858,39 @@ class SecurityMonitor:
         return recommendations
 
 
+def _parse_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+# Environment variable -> (config attribute, converter)
+_ENV_MAPPINGS: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    ('RATE_LIMIT_RPS', 'rate_limit_rps', int),
+    ('RATE_LIMIT_BURST', 'rate_limit_burst', int),
+    ('MAX_REQUEST_SIZE', 'max_request_size', int),
+    ('JWT_SECRET_KEY', 'jwt_secret_key', str),
+    ('JWT_EXPIRATION_HOURS', 'jwt_expiration_hours', int),
+    ('PASSWORD_MIN_LENGTH', 'password_min_length', int),
+    ('MAX_LOGIN_ATTEMPTS', 'max_login_attempts', int),
+    ('LOCKOUT_DURATION_MINUTES', 'lockout_duration_minutes', int),
+    ('ENABLE_SECURITY_LOGGING', 'enable_security_logging', _parse_bool),
+    ('ENABLE_PERFORMANCE_MONITORING', 'enable_performance_monitoring', _parse_bool),
+    ('ALERT_WEBHOOK_URL', 'alert_webhook_url', str),
+)
+
+
+@lru_cache(maxsize=1)
+def _parse_environment_overrides(values: Tuple[Optional[str], ...]) -> Tuple[Tuple[str, Any], ...]:
+    """Convert raw environment values; cached on the values themselves"""
+    overrides = []
+    for (env_var, config_attr, converter), value in zip(_ENV_MAPPINGS, values):
+        if value is not None:
+            try:
+                overrides.append((config_attr, converter(value)))
+            except (ValueError, TypeError) as e:
+                logging.warning(f"Invalid value for {env_var}: {e}")
+    return tuple(overrides)
+
+
 class SecurityConfigManager:
     """Security configuration manager"""
     
@@ -565,32 +960,8 @@ class SecurityConfigManager:
     @classmethod
     def get_environment_config(cls) -> SecurityConfig:
         """Get configuration from environment variables"""
-        config = SecurityConfig()
-        
-        # Map environment variables to config
-        env_mappings = {
-            'RATE_LIMIT_RPS': ('rate_limit_rps', int),
-            'RATE_LIMIT_BURST': ('rate_limit_burst', int),
-            'MAX_REQUEST_SIZE': ('max_request_size', int),
-            'JWT_SECRET_KEY': ('jwt_secret_key', str),
-            'JWT_EXPIRATION_HOURS': ('jwt_expiration_hours', int),
-            'PASSWORD_MIN_LENGTH': ('password_min_length', int),
-            'MAX_LOGIN_ATTEMPTS': ('max_login_attempts', int),
-            'LOCKOUT_DURATION_MINUTES': ('lockout_duration_minutes', int),
-            'ENABLE_SECURITY_LOGGING': ('enable_security_logging', lambda x: x.lower() == 'true'),
-            'ENABLE_PERFORMANCE_MONITORING': ('enable_performance_monitoring', lambda x: x.lower() == 'true'),
-            'ALERT_WEBHOOK_URL': ('alert_webhook_url', str),
-        }
-        
-        for env_var, (config_attr, converter) in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                try:
-                    setattr(config, config_attr, converter(value))
-                except (ValueError, TypeError) as e:
-                    logging.warning(f"Invalid value for {env_var}: {e}")
-        
-        return config
+        values = tuple(os.environ.get(env_var) for env_var, _, _ in _ENV_MAPPINGS)
+        return SecurityConfig(**dict(_parse_environment_overrides(values)))
 
 
 # Export main classes
@@ -6,37 +6,235 @@ Provides interactive API documentation with OpenAPI 3.0 specification
 import os
 import yaml
 import json
-from flask import Flask, jsonify, send_from_directory, request, render_template_string
+import hashlib
+import gzip
+import types
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from pathlib import Path
+from flask import Flask, jsonify, request
 from flask_swagger_ui import get_swaggerui_blueprint
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# docs/api/openapi.yaml at the repository root, resolved once at import
+OPENAPI_PATH = Path(__file__).resolve().parents[4] / 'docs' / 'api' / 'openapi.yaml'
+OPENAPI_FILE = os.fspath(OPENAPI_PATH)
+OPENAPI_EXISTS = OPENAPI_PATH.is_file()
+
+# Spec responses are revalidated on every use but never re-sent unchanged
+SPEC_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+YAML_CACHE_CONTROL = 'public, max-age=300'
+
+# Content codings /openapi.json can be sent with, most compact first
+SPEC_ENCODINGS = tuple(
+    name for name, available in (
+        ('br', BROTLI_AVAILABLE),
+        ('zstd', ZSTD_AVAILABLE),
+        ('gzip', True)
+    ) if available
+)
+
+
+@dataclass(frozen=True)
+class _SpecState:
+    """Everything served for one version of openapi.yaml, built before it is published"""
+    mtime_ns: int
+    yaml_bytes: bytes
+    yaml_etag: str
+    yaml_gzip: bytes
+    # None when the YAML failed to parse; the JSON route then answers 500
+    spec_body: Optional[bytes] = None
+    spec_etag: Optional[str] = None
+    spec_encoded: Dict[str, bytes] = field(default_factory=dict)
+
+
+# Current spec state, replaced in a single assignment when openapi.yaml changes
+_spec_state: Optional[_SpecState] = None
+_spec_lock = threading.Lock()
+
+# The served spec points at whichever origin it was fetched from, so one body
+# (and one set of compressed copies) serves every Host
+SPEC_SERVERS = [{"url": "/", "description": "Current server"}]
+
+
+def _etag(data: bytes) -> str:
+    """Strong validator for a response body"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _loads(data: bytes):
+    """Parse a JSON document, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a JSON body to bytes, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _load_spec(openapi_path: str, yaml_bytes: bytes, yaml_mtime_ns: int) -> dict:
+    """Load the spec, preferring an up-to-date JSON build artifact over parsing the YAML"""
+    # openapi.json is written by build_frontend.py
+    json_path = os.path.splitext(openapi_path)[0] + '.json'
+    try:
+        if os.stat(json_path).st_mtime_ns >= yaml_mtime_ns:
+            with open(json_path, 'rb') as file:
+                return _loads(file.read())
+    except FileNotFoundError:
+        pass
+    
+    return yaml.load(yaml_bytes, Loader=YamlLoader)
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body at maximum level for the given content coding"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=11)
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=19).compress(body)
+    return gzip.compress(body, 9)
+
+
+def _build_spec_state(openapi_path: str, mtime_ns: int) -> _SpecState:
+    """Read, parse, serialize and compress one version of the spec"""
+    with open(openapi_path, 'rb') as file:
+        yaml_bytes = file.read()
+    yaml_fields = {
+        'mtime_ns': mtime_ns,
+        'yaml_bytes': yaml_bytes,
+        'yaml_etag': _etag(yaml_bytes),
+        'yaml_gzip': gzip.compress(yaml_bytes, 9)
+    }
+    
+    try:
+        spec = {**_load_spec(openapi_path, yaml_bytes, mtime_ns), 'servers': SPEC_SERVERS}
+    except Exception as e:
+        # Keep the state (and its mtime) so a broken file is not re-parsed per request
+        print(f"❌ Failed to load OpenAPI spec: {e}")
+        return _SpecState(**yaml_fields)
+    
+    # Serialize and compress once per change rather than per request
+    body = _dumps(spec)
+    return _SpecState(
+        **yaml_fields,
+        spec_body=body,
+        spec_etag=_etag(body),
+        spec_encoded={encoding: _compress(body, encoding) for encoding in SPEC_ENCODINGS}
+    )
+
+
+def _refresh_spec(openapi_path: str) -> _SpecState:
+    """Current spec state, rebuilt first if openapi.yaml changed since the last load"""
+    global _spec_state
+    
+    mtime_ns = os.stat(openapi_path).st_mtime_ns
+    state = _spec_state
+    if state is not None and state.mtime_ns == mtime_ns:
+        return state
+    
+    # One rebuild at a time; requests keep reading the previous state until
+    # the new one is complete
+    with _spec_lock:
+        state = _spec_state
+        if state is None or state.mtime_ns != mtime_ns:
+            state = _build_spec_state(openapi_path, mtime_ns)
+            _spec_state = state
+    return state
+
+
+# Swagger UI settings; shared read-only across blueprint registrations
+SWAGGER_UI_CONFIG = types.MappingProxyType({
+    'app_name': "Crazy-Gary API Documentation",
+    'ui_theme': "material",  # Material theme for better UX
+    'defaultModelsExpandDepth': 2,
+    'defaultModelExpandDepth': 3,
+    'docExpansion': 'list',  # Start with list view
+    'deepLinking': True,
+    'displayRequestDuration': True,
+    'filter': True,
+    'showExtensions': True,
+    'showCommonExtensions': True,
+    'tryItOutEnabled': True,
+    'supportedSubmitMethods': ['get', 'post', 'put', 'delete', 'patch'],
+    'tagsSorter': 'alpha',
+    'operationsSorter': 'alpha'
+})
+
+SWAGGER_URL = '/docs/api'  # URL for exposing Swagger UI
+API_URL = '/openapi.json'  # Our API url (can be JSON or YAML)
+
 def setup_swagger_ui(app):
     """Configure Swagger UI for the Flask application"""
     
     # Load the OpenAPI specification
-    openapi_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'docs', 'api', 'openapi.yaml')
+    openapi_path = OPENAPI_FILE
     
-    if not os.path.exists(openapi_path):
+    if not OPENAPI_EXISTS:
         print("⚠️ OpenAPI specification not found. Skipping Swagger UI setup.")
         return
     
+    # Parse, serialize and compress the specification once up front
+    try:
+        _refresh_spec(openapi_path)
+    except Exception as e:
+        print(f"❌ Failed to load OpenAPI spec: {e}")
+    
     # Create a route to serve the OpenAPI spec as JSON
     @app.route('/openapi.json')
     def serve_openapi_spec():
         """Serve the OpenAPI specification as JSON"""
         try:
-            with open(openapi_path, 'r') as file:
-                spec = yaml.safe_load(file)
+            state = _refresh_spec(openapi_path)
+            if state.spec_body is None:
+                return jsonify({"error": "Failed to load API specification"}), 500
             
-            # Update the server URL to match the current environment
-            server_url = request.host_url.rstrip('/')
-            spec['servers'] = [
-                {
-                    "url": server_url,
-                    "description": "Current server"
-                }
-            ]
+            body, etag = state.spec_body, state.spec_etag
+            encoding = request.accept_encodings.best_match(SPEC_ENCODINGS)
+            if encoding:
+                etag = f'{etag}-{encoding}'
+            headers = {
+                'ETag': f'"{etag}"',
+                'Cache-Control': SPEC_CACHE_CONTROL,
+                'Vary': 'Accept-Encoding'
+            }
+            if request.if_none_match.contains(etag):
+                return '', 304, headers
             
-            return jsonify(spec)
+            if encoding:
+                body = state.spec_encoded[encoding]
+                headers['Content-Encoding'] = encoding
+            return app.response_class(body, mimetype='application/json', headers=headers)
         except Exception as e:
             print(f"❌ Failed to load OpenAPI spec: {e}")
             return jsonify({"error": "Failed to load API specification"}), 500
@@ -46,38 +244,32 @@ def setup_swagger_ui(app):
     def serve_openapi_yaml():
         """Serve the OpenAPI specification as YAML"""
         try:
-            return send_from_directory(
-                os.path.dirname(openapi_path),
-                'openapi.yaml',
-                mimetype='text/yaml'
+            state = _refresh_spec(openapi_path)
+            
+            response = app.response_class(state.yaml_bytes, mimetype='application/yaml')
+            response.set_etag(state.yaml_etag)
+            response.last_modified = state.mtime_ns / 1e9
+            response.headers['Cache-Control'] = YAML_CACHE_CONTROL
+            response.vary.add('Accept-Encoding')
+            
+            # Hand out the precompressed copy unless the client wants a byte range
+            if request.range is None and request.accept_encodings['gzip']:
+                response.set_data(state.yaml_gzip)
+                response.set_etag(state.yaml_etag + '-gzip')
+                response.headers['Content-Encoding'] = 'gzip'
+            
+            return response.make_conditional(
+                request, accept_ranges=True, complete_length=len(state.yaml_bytes)
             )
         except Exception as e:
             print(f"❌ Failed to serve OpenAPI YAML: {e}")
             return "OpenAPI specification not found", 404
     
     # Setup Swagger UI blueprint
-    SWAGGER_URL = '/docs/api'  # URL for exposing Swagger UI
-    API_URL = '/openapi.json'  # Our API url (can be JSON or YAML)
-    
     swaggerui_blueprint = get_swaggerui_blueprint(
         SWAGGER_URL,
         API_URL,
-        config={
-            'app_name': "Crazy-Gary API Documentation",
-            'ui_theme': "material",  # Material theme for better UX
-            'defaultModelsExpandDepth': 2,
-            'defaultModelExpandDepth': 3,
-            'docExpansion': 'list',  # Start with list view
-            'deepLinking': True,
-            'displayRequestDuration': True,
-            'filter': True,
-            'showExtensions': True,
-            'showCommonExtensions': True,
-            'tryItOutEnabled': True,
-            'supportedSubmitMethods': ['get', 'post', 'put', 'delete', 'patch'],
-            'tagsSorter': 'alpha',
-            'operationsSorter': 'alpha',
-        },
+        config=SWAGGER_UI_CONFIG,
         blueprint_name='swagger_ui'
     )
     
@@ -88,10 +280,8 @@ def setup_swagger_ui(app):
     print(f"📚 Interactive API documentation available at: {SWAGGER_URL}")
     print(f"📋 OpenAPI specification available at: {API_URL}")
 
-def create_api_docs_homepage(app):
-    """Create a custom API documentation homepage"""
-    
-    docs_html = """
+# Static documentation homepage; nothing in it is templated
+DOCS_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -302,53 +492,70 @@ def create_api_docs_homepage(app):
     </body>
     </html>
     """
+
+_DOCS_HTML_BYTES = DOCS_HTML.encode('utf-8')
+_DOCS_HTML_ETAG = hashlib.blake2b(_DOCS_HTML_BYTES, digest_size=8).hexdigest()
+
+def create_api_docs_homepage(app):
+    """Create a custom API documentation homepage"""
     
     @app.route('/docs')
     def api_docs_home():
         """Serve the API documentation homepage"""
-        return render_template_string(docs_html)
+        headers = {'ETag': f'"{_DOCS_HTML_ETAG}"', 'Cache-Control': 'public, max-age=3600'}
+        if request.if_none_match.contains(_DOCS_HTML_ETAG):
+            return '', 304, headers
+        return app.response_class(_DOCS_HTML_BYTES, mimetype='text/html', headers=headers)
+
+# Discovery payload for /api; identical for every request
+API_INFO = {
+    "name": "Crazy-Gary API",
+    "version": "1.0.0",
+    "description": "Advanced AI-powered coding assistant with Harmony integration",
+    "documentation": {
+        "interactive": "/docs/api",
+        "openapi_json": "/openapi.json",
+        "openapi_yaml": "/openapi.yaml",
+        "homepage": "/docs"
+    },
+    "endpoints": {
+        "health": "/health",
+        "api_health": "/api/health",
+        "readiness": "/health/ready",
+        "liveness": "/health/live"
+    },
+    "features": [
+        "AI-powered code generation",
+        "Harmony model integration",
+        "MCP tool orchestration",
+        "Real-time monitoring",
+        "WebSocket support",
+        "Comprehensive security"
+    ]
+}
+
+_API_INFO_BYTES = _dumps(API_INFO)
 
 def create_swagger_json_endpoint(app):
     """Create additional endpoints for better API discovery"""
     
+    # Both payloads are fixed for the life of the process, so serialize them once
+    api_version_bytes = _dumps({
+        "api_version": "1.0.0",
+        "service": "crazy-gary-api",
+        "openapi_version": "3.0.3",
+        "environment": os.getenv('ENVIRONMENT', 'development')
+    })
+    
     @app.route('/api')
     def api_info():
         """API information and links to documentation"""
-        return {
-            "name": "Crazy-Gary API",
-            "version": "1.0.0",
-            "description": "Advanced AI-powered coding assistant with Harmony integration",
-            "documentation": {
-                "interactive": "/docs/api",
-                "openapi_json": "/openapi.json",
-                "openapi_yaml": "/openapi.yaml",
-                "homepage": "/docs"
-            },
-            "endpoints": {
-                "health": "/health",
-                "api_health": "/api/health",
-                "readiness": "/health/ready",
-                "liveness": "/health/live"
-            },
-            "features": [
-                "AI-powered code generation",
-                "Harmony model integration", 
-                "MCP tool orchestration",
-                "Real-time monitoring",
-                "WebSocket support",
-                "Comprehensive security"
-            ]
-        }
+        return app.response_class(_API_INFO_BYTES, mimetype='application/json')
     
     @app.route('/api/version')
     def api_version():
         """Get API version information"""
-        return {
-            "api_version": "1.0.0",
-            "service": "crazy-gary-api",
-            "openapi_version": "3.0.3",
-            "environment": os.getenv('ENVIRONMENT', 'development')
-        }
+        return app.response_class(api_version_bytes, mimetype='application/json')
 
 def init_swagger_documentation(app):
     """Initialize complete Swagger documentation system"""
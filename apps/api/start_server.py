@@ -5,21 +5,14 @@ import sys
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from src.bootstrap import get_app, load_env_file, server_settings
+
 # Load environment variables from .env file
-env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
-if os.path.exists(env_file):
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                os.environ[key] = value
+load_env_file(os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'))
 
 # Import and run the Flask app
-from src.main import app
+app, _ = get_app()
 
 if __name__ == '__main__':
-    port = int(os.getenv('PORT', 5000))
-    debug = os.getenv('FLASK_ENV') != 'production'
-    app.run(host='0.0.0.0', port=port, debug=debug)
-
+    host, port, debug = server_settings(5000)
+    app.run(host=host, port=port, debug=debug)
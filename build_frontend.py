@@ -8,33 +8,100 @@ import os
 import sys
 import subprocess
 import shutil
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def log(message):
     """Print log message with timestamp"""
     print(f"[BUILD] {message}")
 
-def run_command(command, cwd=None, check=True):
-    """Run a command and handle errors"""
-    log(f"Running: {command}")
-    try:
-        result = subprocess.run(
-            command.split() if isinstance(command, str) else command,
-            cwd=cwd,
-            check=check,
-            capture_output=True,
-            text=True
-        )
-        if result.stdout:
-            print(result.stdout)
-        return result
-    except subprocess.CalledProcessError as e:
-        log(f"❌ Command failed: {e}")
-        if e.stderr:
-            print(e.stderr)
+# Install and build invocations per package manager, as argv tuples
+INSTALL_COMMANDS = {
+    "pnpm": ("pnpm", "install", "--frozen-lockfile"),
+    "yarn": ("yarn", "install", "--frozen-lockfile"),
+    "npm": ("npm", "install", "--legacy-peer-deps"),
+}
+BUILD_COMMANDS = {
+    "pnpm": ("pnpm", "run", "build"),
+    "yarn": ("yarn", "build"),
+    "npm": ("npm", "run", "build"),
+}
+
+def run_command(command, cwd=None, env=None, check=True):
+    """Run a command, streaming its combined output as it is produced"""
+    if isinstance(command, str):
+        command = command.split()
+    log(f"Running: {' '.join(command)}")
+    with subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True
+    ) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+    
+    if process.returncode != 0:
+        log(f"❌ Command failed with exit code {process.returncode}")
         if check:
             sys.exit(1)
-        return e
+    return process.returncode
+
+def link_or_copy(src, dst):
+    """Hard-link a file into place, copying it when linking is not possible"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def copy_tree(src_dir, dest_dir):
+    """Copy every file under src_dir into dest_dir using a pool of workers"""
+    src_root = os.fspath(src_dir)
+    dest_root = os.fspath(dest_dir)
+    pairs = []
+    for root, _, files in os.walk(src_root):
+        if not files:
+            continue
+        # Create each target directory once up front
+        target_dir = os.path.join(dest_root, os.path.relpath(root, src_root))
+        os.makedirs(target_dir, exist_ok=True)
+        for name in files:
+            pairs.append((os.path.join(root, name), os.path.join(target_dir, name)))
+    
+    workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(link_or_copy, src, dst) for src, dst in pairs]:
+            future.result()
+    
+    log(f"✅ Copied {len(pairs)} files")
+
+def build_openapi_json(base_dir):
+    """Write a JSON copy next to the YAML spec so the API can skip YAML parsing"""
+    spec_path = base_dir / "docs" / "api" / "openapi.yaml"
+    if not spec_path.exists():
+        log("⚠️ OpenAPI specification not found, skipping JSON sidecar")
+        return
+    
+    try:
+        import yaml
+        try:
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader
+        
+        with open(spec_path, 'rb') as file:
+            spec = yaml.load(file, Loader=YamlLoader)
+        
+        json_path = spec_path.with_suffix('.json')
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump(spec, file, ensure_ascii=False, separators=(',', ':'))
+        log(f"✅ OpenAPI JSON written: {json_path}")
+    except Exception as e:
+        log(f"⚠️ Failed to build OpenAPI JSON: {e}")
 
 def main():
     """Main build process"""
@@ -88,12 +155,7 @@ def main():
     log(f"Using package manager: {package_manager}")
     
     # Install dependencies based on available package manager
-    if package_manager == "pnpm":
-        run_command("pnpm install --frozen-lockfile")
-    elif package_manager == "yarn":
-        run_command("yarn install --frozen-lockfile")
-    else:
-        run_command("npm install --legacy-peer-deps")
+    run_command(INSTALL_COMMANDS[package_manager])
     
     # Set build environment variables
     env = os.environ.copy()
@@ -106,24 +168,7 @@ def main():
     # Build the frontend
     log("🎨 Building frontend...")
     
-    # Determine build command based on package manager
-    if package_manager == "pnpm":
-        build_cmd = ["pnpm", "run", "build"]
-    elif package_manager == "yarn":
-        build_cmd = ["yarn", "build"]
-    else:
-        build_cmd = ["npm", "run", "build"]
-    
-    result = subprocess.run(
-        build_cmd,
-        env=env,
-        check=True,
-        capture_output=True,
-        text=True
-    )
-    
-    if result.stdout:
-        print(result.stdout)
+    run_command(BUILD_COMMANDS[package_manager], env=env)
     
     # Check if dist directory was created
     dist_dir = web_dir / "dist"
@@ -139,24 +184,15 @@ def main():
     
     # Remove existing static files
     if api_static_dir.exists():
-        for item in api_static_dir.iterdir():
-            if item.is_file():
-                item.unlink()
-            elif item.is_dir() and item.name != '__pycache__':
-                shutil.rmtree(item)
+        with os.scandir(api_static_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.unlink(entry.path)
+                elif entry.is_dir() and entry.name != '__pycache__':
+                    shutil.rmtree(entry.path)
     
     # Copy all files from dist to static
-    for item in dist_dir.rglob('*'):
-        if item.is_file():
-            # Calculate relative path
-            rel_path = item.relative_to(dist_dir)
-            target_path = api_static_dir / rel_path
-            
-            # Create parent directories if needed
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Copy file
-            shutil.copy2(item, target_path)
+    copy_tree(dist_dir, api_static_dir)
     
     log("✅ Frontend build completed successfully!")
     
@@ -178,6 +214,9 @@ def main():
         if len(asset_files) > 5:
             log(f"   ... and {len(asset_files) - 5} more files")
     
+    # Pre-convert the API specification for the docs endpoints
+    build_openapi_json(base_dir)
+    
     log("🎉 Build process completed successfully!")
 
 if __name__ == "__main__":
@@ -6,20 +6,56 @@ This is an alternative entry point for running the application
 import os
 import sys
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'apps', 'api')
+
+# Make the API's ``src`` package importable, as gunicorn's --chdir does
+sys.path.insert(0, API_DIR)
+
+from src.bootstrap import get_app, server_settings
+
+
+# Flask-SocketIO needs sticky sessions to span several workers and gunicorn has
+# none (the Redis message queue only fans out emits, it does not share
+# Engine.IO sessions), so a single worker is the default. To scale out, run one
+# process per port behind a sticky load balancer rather than raising this.
+DEFAULT_WORKERS = 1
+
+
+def run_production(host, port):
+    """Replace this process with gunicorn serving the API on gevent workers"""
+    workers = int(os.getenv('WEB_CONCURRENCY', DEFAULT_WORKERS))
+    print(f"👷 Workers: {workers}")
+
+    # Access logging is left off; request logging middleware already records requests
+    args = [
+        sys.executable, '-m', 'gunicorn',
+        '--chdir', API_DIR,
+        '--worker-class', 'gevent',
+        '--workers', str(workers),
+        '--bind', f'{host}:{port}',
+        '--timeout', '120',
+        '--keep-alive', '5',
+        '--log-level', 'info'
+    ]
+
+    # The app itself is only imported by gunicorn, never in this process. It is
+    # deliberately not preloaded: importing src.main starts logging listener
+    # threads, the monitoring loop and the scheduler, none of which survive a
+    # fork, so each worker must import the app itself after gevent patching
+    os.execvp(sys.executable, args + ['src.main:app'])
+
 
 # Import and run the main application
 if __name__ == '__main__':
-    from apps.api.src.main import app, socketio
-    
     # Railway sets PORT environment variable, default to 8080 for Railway compatibility
-    port = int(os.getenv('PORT', 8080))
-    host = os.getenv('HOST', '0.0.0.0')
-    debug = os.getenv('FLASK_ENV') != 'production'
-    
+    host, port, debug = server_settings(8080)
+
     print(f"🚀 Starting Crazy-Gary server on {host}:{port}")
     print(f"🔧 Debug mode: {debug}")
     print(f"🌍 Environment: {os.getenv('FLASK_ENV', 'development')}")
-    
-    socketio.run(app, host=host, port=port, debug=debug)
\ No newline at end of file
+
+    if not debug:
+        run_production(host, port)
+
+    app, socketio = get_app()
+    socketio.run(app, host=host, port=port, debug=debug)
@@ -35,6 +35,12 @@ def setup_frontend():
         
         print(f"✅ Frontend deployed to {static_dir}")
         
+    elif os.getenv('RUNTIME_BUILD') != '1':
+        # npm install + build takes minutes and would block startup past the
+        # healthcheck timeout; build_frontend.py does this at build time instead
+        print("⚠️ No frontend build found; run build_frontend.py during the build step")
+        print("⚠️ Continuing with API-only mode (set RUNTIME_BUILD=1 to build at startup)")
+        
     else:
         print("⚠️ No frontend build found, attempting to build...")
         
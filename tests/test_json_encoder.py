@@ -0,0 +1,205 @@
+"""
+JSON Provider Tests
+Tests that ORJSONProvider keeps Flask's wire format for API responses
+"""
+import pytest
+import json
+import sys
+import os
+import uuid
+from dataclasses import dataclass, field
+from typing import List
+from datetime import datetime, date, timezone
+from decimal import Decimal
+from enum import Enum
+
+# The API modules import each other as ``src.*``
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'apps', 'api'))
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+from src.utils import json_encoder
+from src.utils.json_encoder import ORJSONProvider, CustomJSONEncoder
+
+
+class Status(Enum):
+    ACTIVE = 'active'
+    IDLE = 2
+
+
+@dataclass
+class Task:
+    name: str
+    status: Status
+    created: datetime
+
+
+@dataclass
+class Project:
+    name: str
+    tasks: List[Task] = field(default_factory=list)
+    statuses: List[Status] = field(default_factory=list)
+    owner: Task = None
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def provider(request, monkeypatch):
+    """ORJSONProvider on a bare app, with and without orjson"""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_encoder, 'ORJSON_AVAILABLE', False)
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    return app.json
+
+
+@pytest.fixture
+def flask_provider():
+    """Flask's own provider, the reference wire format"""
+    return DefaultJSONProvider(Flask(__name__))
+
+
+class TestFlaskWireFormat:
+    """Types Flask's provider serializes must come out the same"""
+
+    @pytest.mark.parametrize('value', [
+        datetime(2024, 5, 17, 13, 45, 30),
+        datetime(2024, 5, 17, 13, 45, 30, tzinfo=timezone.utc),
+        date(2024, 5, 17),
+        Decimal('12.50'),
+        Decimal('0.1'),
+        uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    ])
+    def test_matches_default_provider(self, provider, flask_provider, value):
+        """Dates, Decimal and UUID serialize exactly as Flask does"""
+        payload = {'value': value, 'nested': [value]}
+        assert provider.loads(provider.dumps(payload)) == json.loads(flask_provider.dumps(payload))
+
+    def test_datetime_is_http_date(self, provider):
+        """Datetimes are RFC 822 HTTP dates, not ISO 8601"""
+        assert provider.loads(provider.dumps(datetime(2024, 5, 17, 13, 45, 30))) == \
+            'Fri, 17 May 2024 13:45:30 GMT'
+
+    def test_decimal_is_string(self, provider):
+        """Decimal keeps its exact digits as a string"""
+        assert provider.loads(provider.dumps({'price': Decimal('12.50')})) == {'price': '12.50'}
+
+    def test_keys_sorted_like_flask(self, provider, flask_provider):
+        """Object keys are sorted, as with Flask's default sort_keys"""
+        payload = {'b': 1, 'a': 2, 'c': {'z': 1, 'y': 2}}
+        assert provider.dumps(payload).replace(' ', '') == flask_provider.dumps(payload).replace(' ', '')
+
+
+class TestExtendedTypes:
+    """Types Flask rejects fall back to CustomJSONEncoder"""
+
+    def test_enum_value(self, provider):
+        """Plain enums serialize as their value"""
+        assert provider.loads(provider.dumps([Status.ACTIVE, Status.IDLE])) == ['active', 2]
+
+    def test_dataclass_with_enum_and_datetime(self, provider):
+        """Dataclass fields use the same formats as top-level values"""
+        task = Task('sync', Status.ACTIVE, datetime(2024, 5, 17, 13, 45, 30))
+        assert provider.loads(provider.dumps(task)) == {
+            'name': 'sync',
+            'status': 'active',
+            'created': 'Fri, 17 May 2024 13:45:30 GMT'
+        }
+
+    def test_unserializable_raises_type_error(self, provider):
+        """Values no encoder understands still raise TypeError"""
+        with pytest.raises(TypeError):
+            provider.dumps({'value': object()})
+
+
+class TestDataclasses:
+    """Dataclasses are walked one level at a time"""
+
+    @pytest.fixture
+    def project(self):
+        created = datetime(2024, 5, 17, 13, 45, 30)
+        return Project(
+            name='api',
+            tasks=[Task('sync', Status.ACTIVE, created), Task('idle', Status.IDLE, created)],
+            statuses=[Status.IDLE, Status.ACTIVE],
+            owner=Task('lead', Status.ACTIVE, created)
+        )
+
+    def test_custom_encoder_nested(self, project):
+        """Nested dataclasses, dataclass lists and enum lists all serialize"""
+        assert json.loads(json.dumps(project, cls=CustomJSONEncoder)) == {
+            'name': 'api',
+            'tasks': [
+                {'name': 'sync', 'status': 'active', 'created': '2024-05-17T13:45:30'},
+                {'name': 'idle', 'status': 2, 'created': '2024-05-17T13:45:30'}
+            ],
+            'statuses': [2, 'active'],
+            'owner': {'name': 'lead', 'status': 'active', 'created': '2024-05-17T13:45:30'}
+        }
+
+    def test_list_items_converted_once(self, project):
+        """Dataclass list items become shallow dicts, not deep copies"""
+        data = CustomJSONEncoder().default(project)
+
+        assert data['tasks'][0] == {
+            'name': 'sync', 'status': Status.ACTIVE, 'created': datetime(2024, 5, 17, 13, 45, 30)
+        }
+        assert data['owner'] is project.owner
+        assert data['statuses'] == [2, 'active']
+
+    def test_mixed_list(self):
+        """Items of another type than the first are left to the encoder"""
+        project = Project('mixed', statuses=[Status.ACTIVE, 'plain', Status.IDLE, 3])
+
+        assert json.loads(json.dumps(project, cls=CustomJSONEncoder))['statuses'] == \
+            ['active', 'plain', 2, 3]
+
+    def test_provider_matches_flask(self, provider, flask_provider, project):
+        """The provider's output equals Flask's asdict-based format"""
+        flask_provider.default = lambda o: (
+            o.value if isinstance(o, Enum) else DefaultJSONProvider.default(o)
+        )
+        assert provider.loads(provider.dumps(project)) == json.loads(flask_provider.dumps(project))
+
+
+class TestResponses:
+    """jsonify goes through the provider"""
+
+    def test_jsonify_uses_flask_formats(self):
+        """A response body carries HTTP dates and string decimals"""
+        app = Flask(__name__)
+        app.json = ORJSONProvider(app)
+
+        with app.app_context():
+            response = jsonify(when=date(2024, 5, 17), amount=Decimal('3.10'))
+
+        assert response.mimetype == 'application/json'
+        assert json.loads(response.get_data()) == {
+            'when': 'Fri, 17 May 2024 00:00:00 GMT',
+            'amount': '3.10'
+        }
+
+
+class TestProviderOptions:
+    """dumps options and the stdlib fallbacks"""
+
+    def test_indent(self, provider):
+        """indent=2 pretty-prints with either backend"""
+        assert provider.dumps({'a': [1]}, indent=2) == '{\n  "a": [\n    1\n  ]\n}'
+
+    def test_non_string_keys(self, provider):
+        """Integer keys become strings, as with json.dumps"""
+        assert provider.loads(provider.dumps({1: 'a', 2: 'b'})) == {'1': 'a', '2': 'b'}
+
+    def test_big_integers(self, provider):
+        """Integers beyond 64 bits fall back to the stdlib encoder"""
+        assert provider.loads(provider.dumps({'n': 2 ** 70})) == {'n': 2 ** 70}
+
+    def test_unsupported_options_use_stdlib(self, provider):
+        """json.dumps-only options are honoured"""
+        assert provider.dumps({'s': 'é'}, ensure_ascii=True) == '{"s": "\\u00e9"}'
+
+    def test_loads_bytes_and_str(self, provider):
+        """Request bodies parse from bytes or str"""
+        assert provider.loads(b'{"a": 1}') == provider.loads('{"a": 1}') == {'a': 1}
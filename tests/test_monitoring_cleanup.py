@@ -0,0 +1,129 @@
+"""
+Monitoring Retention Tests
+Tests for the chunked deletes that purge expired monitoring data
+"""
+import pytest
+import os
+import sys
+import importlib
+from datetime import datetime, timedelta
+from unittest import mock
+
+# The API modules import each other as ``src.*``
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'apps', 'api'))
+
+from flask import Flask
+from sqlalchemy import event
+from src.models.user import db
+
+# monitoring_setup imports every monitoring service and model at load time.
+# The purge only needs the session, so stand-ins replace them for the import,
+# along with psutil and requests when they are not installed
+_STAND_INS = {name: mock.MagicMock() for name in (
+    'src.services.monitoring_service',
+    'src.services.infrastructure_monitor',
+    'src.services.synthetic_monitor',
+    'src.services.external_integrations',
+    'src.models.monitoring_models',
+)}
+for optional, submodules in (('psutil', ()), ('requests', ('requests.adapters',))):
+    try:
+        importlib.import_module(optional)
+    except ImportError:
+        for name in (optional, *submodules):
+            _STAND_INS[name] = mock.MagicMock()
+
+with mock.patch.dict(sys.modules, _STAND_INS):
+    from src.utils import monitoring_setup
+    from src.utils.monitoring_setup import MonitoringSystemInitializer
+
+
+class RetentionRecord(db.Model):
+    """Stand-in for the timestamped monitoring tables"""
+    __tablename__ = 'test_retention_records'
+
+    id = db.Column(db.Integer, primary_key=True)
+    timestamp = db.Column(db.DateTime, nullable=False)
+
+
+CUTOFF = datetime(2024, 1, 31)
+
+
+@pytest.fixture
+def app():
+    """App bound to an in-memory database seeded with old and recent rows"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            [RetentionRecord(timestamp=CUTOFF - timedelta(minutes=i + 1)) for i in range(2500)]
+            + [RetentionRecord(timestamp=CUTOFF)]
+            + [RetentionRecord(timestamp=CUTOFF + timedelta(days=1)) for _ in range(4)]
+        )
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def initializer(app):
+    return MonitoringSystemInitializer(app)
+
+
+@pytest.fixture
+def delete_statements(app):
+    """DELETE statements sent to the database, with their parameter counts"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('DELETE'):
+            statements.append(len(parameters))
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', record)
+
+
+class TestChunkedDeletes:
+    """Test _delete_in_chunks"""
+
+    def test_deletes_only_expired_rows(self, app, initializer):
+        """Test rows older than the cutoff go and the rest stay"""
+        with app.app_context():
+            deleted = initializer._delete_in_chunks(RetentionRecord, CUTOFF)
+
+            assert deleted == 2500
+            remaining = db.session.scalars(db.select(RetentionRecord.timestamp)).all()
+            assert len(remaining) == 5
+            assert min(remaining) == CUTOFF
+
+    def test_batches_follow_chunk_size(self, app, initializer, delete_statements, monkeypatch):
+        """Test each batch is one statement, plus a final empty one"""
+        monkeypatch.setattr(monitoring_setup, 'CLEANUP_CHUNK_SIZE', 1000)
+
+        with app.app_context():
+            assert initializer._delete_in_chunks(RetentionRecord, CUTOFF) == 2500
+
+        assert len(delete_statements) == 4
+
+    def test_batches_bind_no_id_lists(self, app, initializer, delete_statements, monkeypatch):
+        """Test batches larger than SQLite's 999-variable limit bind only cutoff and limit"""
+        monkeypatch.setattr(monitoring_setup, 'CLEANUP_CHUNK_SIZE', 2000)
+
+        with app.app_context():
+            assert initializer._delete_in_chunks(RetentionRecord, CUTOFF) == 2500
+
+        assert delete_statements and max(delete_statements) <= 3
+
+    def test_nothing_to_delete(self, app, initializer):
+        """Test an empty purge returns zero"""
+        with app.app_context():
+            assert initializer._delete_in_chunks(RetentionRecord, CUTOFF - timedelta(days=365)) == 0
+            assert db.session.query(RetentionRecord).count() == 2505
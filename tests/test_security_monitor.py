@@ -0,0 +1,271 @@
+"""
+Security Monitor Tests
+Tests for IP filtering, unique-IP estimation, per-IP windows, alerts and webhooks
+"""
+import pytest
+import os
+import sys
+import logging
+import ipaddress
+import threading
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+# The API modules import each other as ``src.*``
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'apps', 'api'))
+
+from src.utils import security_monitor
+from src.utils.security_monitor import (
+    IPNetworkSet, CardinalityEstimator, SecurityConfig, SecurityMonitor, SecurityAlert, AlertSeverity,
+    AUTH_FAILURE_WINDOW
+)
+
+
+class TestIPNetworkSet:
+    """Test IPv4/IPv6 address and CIDR membership"""
+
+    def test_exact_addresses(self):
+        """Test single addresses match only themselves"""
+        networks = IPNetworkSet(['192.168.1.10', '2001:db8::1'])
+
+        assert '192.168.1.10' in networks
+        assert '2001:db8::1' in networks
+        assert '192.168.1.11' not in networks
+        assert '2001:db8::2' not in networks
+
+    def test_cidr_ranges(self):
+        """Test addresses inside a range match and neighbours do not"""
+        networks = IPNetworkSet(['10.0.0.0/8', '172.16.0.0/12', '2001:db8::/32'])
+
+        assert '10.255.255.255' in networks
+        assert '172.31.0.1' in networks
+        assert '172.32.0.1' not in networks
+        assert '11.0.0.0' not in networks
+        assert '2001:db8:ffff::1' in networks
+        assert '2001:db9::1' not in networks
+
+    def test_overlapping_prefixes(self):
+        """Test every configured prefix length is consulted"""
+        networks = IPNetworkSet(['10.1.2.3/32', '10.0.0.0/16', '0.0.0.0/0'])
+
+        assert '10.1.2.3' in networks
+        assert '10.0.5.5' in networks
+        assert '8.8.8.8' in networks
+        assert '::1' not in networks
+
+    def test_host_bits_are_masked(self):
+        """Test a range written with host bits set behaves like its network"""
+        networks = IPNetworkSet(['192.168.1.77/24'])
+
+        assert '192.168.1.1' in networks
+        assert '192.168.2.1' not in networks
+
+    def test_versions_do_not_mix(self):
+        """Test IPv4 entries never match IPv6 addresses of the same integer value"""
+        networks = IPNetworkSet(['0.0.0.1'])
+
+        assert '::1' not in networks
+
+    def test_invalid_entries_ignored(self):
+        """Test malformed entries are skipped rather than failing the whole set"""
+        networks = IPNetworkSet(['not-an-ip', '10.0.0.0/33', ' 10.0.0.1 '])
+
+        assert len(networks) == 1
+        assert '10.0.0.1' in networks
+
+    @pytest.mark.parametrize('value', ['', 'localhost', '10.0.0', '300.1.1.1', '10.0.0.0/8'])
+    def test_invalid_lookups(self, value):
+        """Test lookups of values that are not addresses return False"""
+        assert value not in IPNetworkSet(['0.0.0.0/0', '::/0'])
+
+    def test_matches_ipaddress(self):
+        """Test membership agrees with the ipaddress module across a range"""
+        entries = ['10.0.0.0/30', '10.0.0.8/29', '10.0.0.20']
+        networks = IPNetworkSet(entries)
+        reference = [ipaddress.ip_network(entry) for entry in entries]
+
+        for host in range(32):
+            address = f'10.0.0.{host}'
+            expected = any(ipaddress.ip_address(address) in network for network in reference)
+            assert (address in networks) == expected, address
+
+    def test_config_filters(self):
+        """Test SecurityConfig block and allow lists use the set"""
+        config = SecurityConfig(blocked_ips=['203.0.113.0/24'], whitelist_ips=['203.0.113.7'])
+
+        assert config.is_blocked('203.0.113.9')
+        assert config.is_whitelisted('203.0.113.7')
+        assert not config.is_blocked('198.51.100.1')
+
+
+class TestCardinalityEstimator:
+    """Test exact counting and the HyperLogLog fallback"""
+
+    def test_exact_below_limit(self):
+        """Test counts are exact while under exact_limit"""
+        estimator = CardinalityEstimator(exact_limit=100)
+        for i in range(250):
+            estimator.add(f'10.0.0.{i % 50}')
+
+        assert len(estimator) == 50
+
+    def test_switches_to_sketch(self):
+        """Test the exact set is released once exact_limit is passed"""
+        estimator = CardinalityEstimator(exact_limit=10)
+        for i in range(11):
+            estimator.add(i)
+
+        assert estimator._exact is None
+        assert len(estimator._registers) == 1 << estimator.precision
+
+    @pytest.mark.parametrize('distinct', [500, 5_000, 50_000])
+    def test_estimate_within_error(self, distinct):
+        """Test sketch estimates stay within a few standard errors"""
+        estimator = CardinalityEstimator(exact_limit=0)
+        for i in range(distinct):
+            estimator.add(f'192.0.{i >> 8 & 255}.{i & 255}-{i}')
+
+        # ~1.6% standard error at precision 12
+        assert abs(len(estimator) - distinct) <= distinct * 0.06
+
+    def test_duplicates_do_not_inflate(self):
+        """Test re-adding values leaves the estimate unchanged"""
+        estimator = CardinalityEstimator(exact_limit=0)
+        for i in range(2_000):
+            estimator.add(i)
+        first = len(estimator)
+        for i in range(2_000):
+            estimator.add(i)
+
+        assert len(estimator) == first
+
+    def test_monitor_unique_ips(self):
+        """Test the monitor reports distinct request IPs"""
+        monitor = SecurityMonitor(SecurityConfig(enable_security_logging=False))
+        for ip in ['1.1.1.1', '1.1.1.2', '1.1.1.1']:
+            monitor.record_request(ip)
+
+        assert monitor.get_metrics()['unique_ips'] == 2
+
+
+class TestPerIPWindows:
+    """Test the per-IP event indexes stay bounded"""
+
+    @pytest.fixture
+    def monitor(self):
+        return SecurityMonitor(SecurityConfig(enable_security_logging=False))
+
+    def test_least_recently_seen_evicted(self, monitor, monkeypatch):
+        """Test the index is capped at MAX_TRACKED_IPS"""
+        monkeypatch.setattr(security_monitor, 'MAX_TRACKED_IPS', 3)
+        for host in range(5):
+            monitor.record_auth_failure(f'10.0.0.{host}')
+        monitor.record_auth_failure('10.0.0.2')
+
+        assert list(monitor._auth_failures_by_ip) == ['10.0.0.3', '10.0.0.4', '10.0.0.2']
+        assert monitor._get_recent_auth_failures('10.0.0.2') == 2
+
+    def test_empty_windows_forgotten(self, monitor):
+        """Test an IP is dropped once its window holds no events"""
+        monitor.record_auth_failure('10.0.0.1')
+        monitor._auth_failures_by_ip['10.0.0.1'][0] -= AUTH_FAILURE_WINDOW + 1
+
+        assert monitor._get_recent_auth_failures('10.0.0.1') == 0
+        assert '10.0.0.1' not in monitor._auth_failures_by_ip
+
+    def test_unknown_ip(self, monitor):
+        """Test lookups for unseen IPs do not create entries"""
+        assert monitor._get_recent_rate_limit_hits('10.0.0.9') == 0
+        assert not monitor._rate_limit_hits_by_ip
+
+
+class TestAlertTimestamps:
+    """Test alert creation times from naive and aware datetimes"""
+
+    def test_naive_utc(self):
+        """Test a naive datetime is taken as UTC"""
+        when = datetime(2024, 5, 17, 13, 45, 30, 123456)
+        alert = SecurityAlert('test', AlertSeverity.INFO, 'naive', timestamp=when)
+
+        assert alert.timestamp == when
+        assert alert.timestamp_ns == int(when.replace(tzinfo=timezone.utc).timestamp()) * 10**9 + 123456000
+
+    def test_aware_normalized_to_utc(self):
+        """Test an aware datetime in any zone becomes the same naive UTC time"""
+        local = datetime(2024, 5, 17, 15, 45, 30, tzinfo=timezone(timedelta(hours=2)))
+        alert = SecurityAlert('test', AlertSeverity.INFO, 'aware', timestamp=local)
+
+        assert alert.timestamp == datetime(2024, 5, 17, 13, 45, 30)
+        assert alert.timestamp_ns == int(local.timestamp()) * 10**9
+        assert alert.to_dict()['timestamp'] == '2024-05-17T13:45:30'
+
+    def test_default_is_now(self):
+        """Test alerts without a timestamp use the current time"""
+        before = datetime.utcnow().replace(microsecond=0)
+        alert = SecurityAlert('test', AlertSeverity.INFO, 'now')
+
+        assert before <= alert.timestamp <= datetime.utcnow()
+
+
+class _StalledResponse:
+    status_code = 200
+
+
+class _StalledSession:
+    """Webhook session whose posts wait until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.posts = 0
+
+    def post(self, url, **kwargs):
+        self.posts += 1
+        self.release.wait(5)
+        return _StalledResponse()
+
+
+class TestWebhookBacklog:
+    """Test webhook deliveries stay bounded when the endpoint is slow"""
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        session = _StalledSession()
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(SecurityMonitor, '_webhook_session', session)
+        monkeypatch.setattr(SecurityMonitor, '_webhook_pool', pool)
+        monkeypatch.setattr(SecurityMonitor, '_webhook_slots', threading.BoundedSemaphore(2))
+        yield session
+        session.release.set()
+        pool.shutdown(wait=True)
+
+    @pytest.fixture
+    def monitor(self):
+        monitor = SecurityMonitor(SecurityConfig(
+            enable_security_logging=False, alert_webhook_url='https://hooks.invalid/alert'
+        ))
+        monitor.logger = logging.getLogger('test_security_monitor')
+        return monitor
+
+    def _alert(self):
+        return SecurityAlert('test', AlertSeverity.INFO, 'webhook backlog')
+
+    def test_alerts_beyond_limit_dropped(self, monitor, session, caplog):
+        """Test only the pending limit is queued and the overflow is logged once"""
+        with caplog.at_level(logging.WARNING, logger='test_security_monitor'):
+            for _ in range(5):
+                monitor._send_webhook_alert(self._alert())
+
+        assert monitor.get_metrics()['webhooks_dropped'] == 3
+        assert len([r for r in caplog.records if 'backlog full' in r.getMessage()]) == 1
+
+    def test_slots_freed_after_delivery(self, monitor, session):
+        """Test completed deliveries make room for new alerts"""
+        for _ in range(2):
+            monitor._send_webhook_alert(self._alert())
+        session.release.set()
+        SecurityMonitor._webhook_pool.shutdown(wait=True)
+
+        assert SecurityMonitor._webhook_slots.acquire(blocking=False)
+        assert SecurityMonitor._webhook_slots.acquire(blocking=False)
+        assert session.posts == 2
+        assert monitor.get_metrics()['webhooks_dropped'] == 0
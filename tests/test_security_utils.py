@@ -0,0 +1,540 @@
+"""
+Security Utilities Tests
+Tests for HS256 JWT handling and password hashing
+"""
+import pytest
+import os
+import sys
+import time
+import json
+import hmac
+import base64
+import hashlib
+import types
+from unittest.mock import Mock
+from flask import Flask
+
+# The API modules import each other as ``src.*``
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'apps', 'api'))
+
+# security.py creates its Redis client at import time. Without redis-py it
+# is imported against an empty stand-in module and runs with no client
+try:
+    import redis
+    redis_stub = None
+except ImportError:
+    redis_stub = sys.modules['redis'] = types.ModuleType('redis')
+
+from src.utils import security
+from src.utils.security import (
+    SecurityConfig, AuthenticationError, RateLimitError,
+    generate_jwt_token, verify_jwt_token, hash_password, verify_password,
+    blacklist_token, revoke_jwt_token, rate_limit, check_login_attempts, record_login_attempt
+)
+
+if redis_stub is not None:
+    del sys.modules['redis']
+
+SECRET = 'test-secret-key-that-is-at-least-32-bytes'
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the security code uses"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def ttl(self, key):
+        return self.ttls.get(key, -1)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+        self.ttls.pop(key, None)
+
+    def counter_script(self, refresh_expiry):
+        """Stand-in for the Lua counters: INCR, then EXPIRE on the first hit or every hit"""
+        def script(keys, args, client=None):
+            key = keys[0]
+            count = self.data[key] = int(self.data.get(key, 0)) + 1
+            if refresh_expiry or count == 1:
+                self.ttls[key] = args[0]
+            return count
+        return script
+
+
+def b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def forge(payload, header=None, key=SECRET, digestmod=hashlib.sha256):
+    """Build a token by hand, independently of the module under test"""
+    header = header or {'alg': 'HS256', 'typ': 'JWT'}
+    signing_input = f"{b64url(json.dumps(header).encode())}.{b64url(json.dumps(payload).encode())}"
+    signature = hmac.new(key.encode(), signing_input.encode(), digestmod).digest()
+    return f"{signing_input}.{b64url(signature)}"
+
+
+def claims(**overrides):
+    payload = {
+        'user_id': 'u1',
+        'email': 'user@example.com',
+        'token_type': 'access',
+        'exp': int(time.time()) + 300,
+        'iat': int(time.time()),
+        'jti': 'jti-1'
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.fixture(autouse=True)
+def security_state(monkeypatch):
+    """Known secret, no Redis and an empty token cache for every test"""
+    monkeypatch.setattr(SecurityConfig, 'JWT_SECRET_KEY', SECRET)
+    monkeypatch.setattr(security, 'redis_client', None)
+    security._token_cache.clear()
+    yield
+    security._token_cache.clear()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(security, 'redis_client', client)
+    monkeypatch.setattr(security, '_rate_limit_script', client.counter_script(refresh_expiry=False))
+    monkeypatch.setattr(security, '_login_attempt_script', client.counter_script(refresh_expiry=True))
+    return client
+
+
+class TestHS256Tokens:
+    """Test JWT signing and verification"""
+
+    def test_round_trip(self):
+        """Test a generated token verifies to its claims"""
+        payload = verify_jwt_token(generate_jwt_token('u1', 'user@example.com'))
+
+        assert payload['user_id'] == 'u1'
+        assert payload['email'] == 'user@example.com'
+        assert payload['token_type'] == 'access'
+        assert isinstance(payload['jti'], str)
+
+    def test_hand_built_token(self):
+        """Test a correctly signed token from another encoder is accepted"""
+        assert verify_jwt_token(forge(claims()))['user_id'] == 'u1'
+
+    def test_tampered_signature(self):
+        """Test a modified signature is rejected"""
+        header, payload, signature = generate_jwt_token('u1', 'user@example.com').split('.')
+        tampered = signature[:-2] + ('AA' if signature[-2:] != 'AA' else 'BB')
+
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(f"{header}.{payload}.{tampered}")
+
+    def test_tampered_payload(self):
+        """Test claims swapped under an existing signature are rejected"""
+        header, _, signature = generate_jwt_token('u1', 'user@example.com').split('.')
+        payload = b64url(json.dumps(claims(user_id='admin')).encode())
+
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(f"{header}.{payload}.{signature}")
+
+    def test_wrong_key(self):
+        """Test a token signed with another key is rejected"""
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(forge(claims(), key='another-secret-key-of-32-bytes-long'))
+
+    def test_alg_none(self):
+        """Test an unsigned alg=none token is rejected"""
+        header = b64url(json.dumps({'alg': 'none', 'typ': 'JWT'}).encode())
+        payload = b64url(json.dumps(claims()).encode())
+
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(f"{header}.{payload}.")
+
+    @pytest.mark.parametrize('alg', ['RS256', 'HS512', 'hs256'])
+    def test_alg_confusion(self, alg):
+        """Test a header naming any algorithm but HS256 is rejected, even with a valid HMAC"""
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(forge(claims(), header={'alg': alg, 'typ': 'JWT'}))
+
+    def test_hs512_signature(self):
+        """Test an HS512-signed token is rejected"""
+        token = forge(claims(), header={'alg': 'HS512', 'typ': 'JWT'}, digestmod=hashlib.sha512)
+
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(token)
+
+    def test_expired(self):
+        """Test an expired token is rejected as expired"""
+        with pytest.raises(AuthenticationError, match='expired'):
+            verify_jwt_token(forge(claims(exp=int(time.time()) - 10)))
+
+    def test_missing_secret(self, monkeypatch):
+        """Test an unconfigured secret is a configuration error"""
+        monkeypatch.setattr(SecurityConfig, 'JWT_SECRET_KEY', None)
+
+        with pytest.raises(ValueError):
+            generate_jwt_token('u1', 'user@example.com')
+
+
+class TestEarlyRejection:
+    """Test malformed and forged tokens are rejected before any Redis lookup"""
+
+    @pytest.mark.parametrize('token', ['', 'abc', 'a.b', 'a.b.c.d', '!!.$$.%%', 'a' * 5000])
+    def test_malformed(self, fake_redis, token):
+        """Test structurally invalid tokens are rejected without a lookup"""
+        fake_redis.exists = Mock(return_value=0)
+
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(token)
+        fake_redis.exists.assert_not_called()
+
+    @pytest.mark.parametrize('jti', [5, 1.5, ['jti-1'], {'id': 'jti-1'}, True])
+    def test_non_string_jti(self, fake_redis, jti):
+        """Test a signed token with a non-string jti fails authentication"""
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(forge(claims(jti=jti)))
+
+    def test_forged_token_never_reaches_redis(self, fake_redis):
+        """Test the signature is checked before the blacklist lookup"""
+        fake_redis.exists = Mock(return_value=0)
+
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(forge(claims(), key='another-secret-key-of-32-bytes-long'))
+        fake_redis.exists.assert_not_called()
+
+
+class TestPyJWTInterop:
+    """Test tokens stay compatible with PyJWT, still used by the middleware and auth_redis"""
+
+    @pytest.fixture(autouse=True)
+    def pyjwt(self):
+        return pytest.importorskip('jwt')
+
+    def test_pyjwt_decodes_generated_token(self, pyjwt):
+        """Test PyJWT verifies tokens produced here"""
+        token = generate_jwt_token('u1', 'user@example.com', token_type='refresh')
+        decoded = pyjwt.decode(token, SECRET, algorithms=['HS256'])
+
+        assert decoded == verify_jwt_token(token)
+        assert decoded['token_type'] == 'refresh'
+
+    def test_pyjwt_token_verifies(self, pyjwt):
+        """Test tokens produced by PyJWT verify here"""
+        token = pyjwt.encode(claims(), SECRET, algorithm='HS256')
+
+        assert verify_jwt_token(token)['user_id'] == 'u1'
+
+    def test_pyjwt_rejects_tampered_token(self, pyjwt):
+        """Test both sides agree a tampered token is invalid"""
+        header, _, signature = generate_jwt_token('u1', 'user@example.com').split('.')
+        tampered = f"{header}.{b64url(json.dumps(claims(user_id='admin')).encode())}.{signature}"
+
+        with pytest.raises(pyjwt.InvalidSignatureError):
+            pyjwt.decode(tampered, SECRET, algorithms=['HS256'])
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(tampered)
+
+
+class TestPasswords:
+    """Test bcrypt hashing, the hash guard and the verify cache"""
+
+    @pytest.fixture(autouse=True)
+    def fast_bcrypt(self, monkeypatch):
+        monkeypatch.setattr(SecurityConfig, 'BCRYPT_ROUNDS', 4)
+        security._verify_cache.clear()
+        yield
+        security._verify_cache.clear()
+
+    @pytest.fixture
+    def bcrypt_calls(self, monkeypatch):
+        """Names of the bcrypt functions run, in order"""
+        calls = []
+        run = security._run_bcrypt
+
+        def spy(func, *args):
+            calls.append(func.__name__)
+            return run(func, *args)
+
+        monkeypatch.setattr(security, '_run_bcrypt', spy)
+        return calls
+
+    def test_round_trip(self):
+        """Test a hash verifies its password and no other"""
+        hashed = hash_password('correct horse')
+
+        assert hashed.startswith('$2b$04$') and len(hashed) == 60
+        assert verify_password('correct horse', hashed)
+        assert not verify_password('wrong horse', hashed)
+
+    @pytest.mark.parametrize('hashed', ['', 'plain', '$2b$04$short', '$1$' + 'a' * 57])
+    def test_malformed_hash_skips_bcrypt(self, bcrypt_calls, hashed):
+        """Test values that are not bcrypt hashes are rejected without hashing"""
+        assert not verify_password('secret', hashed)
+        assert bcrypt_calls == []
+
+    def test_invalid_salt_is_false(self):
+        """Test a well-shaped hash with an unusable salt fails rather than raising"""
+        assert not verify_password('secret', '$2b$04$' + '!' * 53)
+
+    def test_cache_skips_repeat_verification(self, bcrypt_calls, monkeypatch):
+        """Test a recently verified credential does not rerun bcrypt"""
+        monkeypatch.setattr(SecurityConfig, 'ENABLE_VERIFY_CACHE', True)
+        hashed = hash_password('secret')
+
+        assert verify_password('secret', hashed)
+        assert verify_password('secret', hashed)
+        assert not verify_password('guess', hashed)
+        assert not verify_password('guess', hashed)
+        assert bcrypt_calls == ['hashpw', 'checkpw', 'checkpw', 'checkpw']
+
+    def test_gevent_offloads_to_hub_threadpool(self, monkeypatch):
+        """Test bcrypt runs in the hub's native threadpool once threading is patched"""
+        applied = []
+        threadpool = Mock()
+        threadpool.apply.side_effect = lambda func, args: applied.append(func.__name__) or func(*args)
+        monkeypatch.setattr(security, 'GEVENT_AVAILABLE', True)
+        monkeypatch.setattr(security, 'gevent_monkey', Mock(is_module_patched=lambda name: True))
+        monkeypatch.setattr(security, 'gevent', Mock(get_hub=lambda: Mock(threadpool=threadpool)))
+
+        assert verify_password('secret', hash_password('secret'))
+        assert applied == ['hashpw', 'checkpw']
+
+
+class TestTokenCache:
+    """Test the verified-token cache"""
+
+    def test_repeat_verification_is_cached(self, monkeypatch):
+        """Test a verified token skips the signature check until its entry expires"""
+        verify_signature = Mock(wraps=security._verify_hs256_signature)
+        monkeypatch.setattr(security, '_verify_hs256_signature', verify_signature)
+        token = generate_jwt_token('u1', 'user@example.com')
+
+        assert verify_jwt_token(token) == verify_jwt_token(token)
+        assert verify_signature.call_count == 1
+
+    def test_entries_expire(self, monkeypatch):
+        """Test cache entries are not served past TOKEN_CACHE_TTL"""
+        monkeypatch.setattr(security, 'TOKEN_CACHE_TTL', 0)
+        verify_signature = Mock(wraps=security._verify_hs256_signature)
+        monkeypatch.setattr(security, '_verify_hs256_signature', verify_signature)
+        token = generate_jwt_token('u1', 'user@example.com')
+
+        verify_jwt_token(token)
+        verify_jwt_token(token)
+        assert verify_signature.call_count == 2
+
+    def test_entries_never_outlive_the_token(self):
+        """Test an entry expires with the token's own exp"""
+        exp = int(time.time()) + 5
+        token = forge(claims(exp=exp))
+        verify_jwt_token(token)
+
+        _, valid_until = security._token_cache[security._token_cache_key(token)]
+        assert valid_until == exp
+
+    def test_size_is_bounded(self, monkeypatch):
+        """Test the least recently used entry is evicted at TOKEN_CACHE_MAX_SIZE"""
+        monkeypatch.setattr(security, 'TOKEN_CACHE_MAX_SIZE', 2)
+        tokens = [forge(claims(jti=f'jti-{i}')) for i in range(3)]
+        for token in tokens:
+            verify_jwt_token(token)
+
+        assert len(security._token_cache) == 2
+        assert security._token_cache_key(tokens[0]) not in security._token_cache
+
+    def test_rejected_tokens_are_not_cached(self):
+        """Test only successfully verified tokens are stored"""
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(forge(claims(), key='another-secret-key-of-32-bytes-long'))
+
+        assert not security._token_cache
+
+    def test_revoked_token_rejected_even_when_cached(self, fake_redis):
+        """Test revocation evicts the cached payload in this process"""
+        token = forge(claims())
+        verify_jwt_token(token)
+        assert security._token_cache_key(token) in security._token_cache
+
+        revoke_jwt_token(token)
+
+        with pytest.raises(AuthenticationError, match='revoked'):
+            verify_jwt_token(token)
+
+    def test_blacklist_without_redis_still_evicts(self):
+        """Test blacklisting drops cached payloads even when Redis is unavailable"""
+        token = forge(claims())
+        verify_jwt_token(token)
+
+        blacklist_token('jti-1', int(time.time()) + 60)
+
+        assert security._token_cache_key(token) not in security._token_cache
+
+
+class TestRevocation:
+    """Test exp enforcement and blacklist entries that expire with the token"""
+
+    @pytest.mark.parametrize('exp', [None, 'tomorrow'])
+    def test_missing_or_invalid_exp(self, exp):
+        """Test exp is required and numeric"""
+        payload = claims(exp=exp)
+        if exp is None:
+            del payload['exp']
+
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(forge(payload))
+
+    def test_expired_token_never_reaches_redis(self, fake_redis):
+        """Test expiry is checked before the blacklist lookup"""
+        fake_redis.exists = Mock(return_value=0)
+
+        with pytest.raises(AuthenticationError):
+            verify_jwt_token(forge(claims(exp=int(time.time()) - 10)))
+        fake_redis.exists.assert_not_called()
+
+    def test_revoke_blacklists_until_expiry(self, fake_redis):
+        """Test revoke_jwt_token stores the jti for the token's remaining lifetime"""
+        exp = int(time.time()) + 120
+        token = forge(claims(exp=exp))
+        revoke_jwt_token(token)
+
+        key = b'blacklist:jti-1'
+        assert fake_redis.exists(key)
+        assert 0 < fake_redis.ttls[key] <= 120
+
+    def test_blacklist_from_another_process(self, fake_redis):
+        """Test a jti blacklisted directly in Redis is rejected"""
+        fake_redis.setex(b'blacklist:jti-1', 60, '1')
+
+        with pytest.raises(AuthenticationError, match='revoked'):
+            verify_jwt_token(forge(claims()))
+
+    def test_expired_entries_are_not_written(self, fake_redis):
+        """Test a jti whose token already expired is not stored"""
+        blacklist_token('jti-old', int(time.time()) - 1)
+
+        assert not fake_redis.data
+
+
+class TestRateLimit:
+    """Test the rate_limit decorator"""
+
+    @pytest.fixture
+    def app(self):
+        return Flask(__name__)
+
+    def test_limit_enforced(self, app, fake_redis):
+        """Test requests beyond max_requests raise RateLimitError"""
+        endpoint = rate_limit(max_requests=2, window=60)(lambda: 'ok')
+        with app.test_request_context(environ_base={'REMOTE_ADDR': '10.0.0.1'}):
+            assert endpoint() == 'ok'
+            assert endpoint() == 'ok'
+            with pytest.raises(RateLimitError):
+                endpoint()
+
+        assert fake_redis.data == {b'rate_limit:ip:10.0.0.1': 3}
+
+    def test_window_passed_to_script(self, app, fake_redis, monkeypatch):
+        """Test the window is sent as the script's expiry argument"""
+        script = Mock(return_value=1)
+        monkeypatch.setattr(security, '_rate_limit_script', script)
+
+        with app.test_request_context():
+            rate_limit(window=30)(lambda: 'ok')()
+
+        assert script.call_args.kwargs['args'] == [30]
+
+    def test_custom_key(self, app, fake_redis):
+        """Test key_func replaces the per-IP key"""
+        endpoint = rate_limit(max_requests=5, key_func=lambda: b'rate_limit:custom')(lambda: 'ok')
+
+        with app.test_request_context():
+            endpoint()
+
+        assert fake_redis.data == {b'rate_limit:custom': 1}
+
+    def test_skipped_without_redis(self, app):
+        """Test the decorator is a pass-through when Redis is unavailable"""
+        endpoint = rate_limit(max_requests=1)(lambda: 'ok')
+
+        with app.test_request_context():
+            assert [endpoint() for _ in range(3)] == ['ok', 'ok', 'ok']
+
+
+class TestLoginAttempts:
+    """Test failed-login lockout"""
+
+    def test_locked_after_max_attempts(self, fake_redis, monkeypatch):
+        """Test the account locks once MAX_LOGIN_ATTEMPTS failures are recorded"""
+        monkeypatch.setattr(SecurityConfig, 'MAX_LOGIN_ATTEMPTS', 3)
+        for _ in range(2):
+            record_login_attempt('user@example.com', success=False)
+        check_login_attempts('user@example.com')
+
+        record_login_attempt('user@example.com', success=False)
+
+        with pytest.raises(AuthenticationError, match='locked'):
+            check_login_attempts('user@example.com')
+        assert fake_redis.ttl(b'login_attempts:user@example.com') == SecurityConfig.LOCKOUT_SECONDS
+
+    def test_success_clears_failures(self, fake_redis, monkeypatch):
+        """Test a successful login resets the failure count"""
+        monkeypatch.setattr(SecurityConfig, 'MAX_LOGIN_ATTEMPTS', 1)
+        record_login_attempt('user@example.com', success=False)
+        record_login_attempt('user@example.com', success=True)
+
+        check_login_attempts('user@example.com')
+        assert not fake_redis.data
+
+
+class TestCounterScripts:
+    """Test the Lua counter scripts against a live Redis server"""
+
+    @pytest.fixture
+    def live_redis(self):
+        redis = pytest.importorskip('redis')
+        client = redis.Redis(host=os.getenv('REDIS_HOST', 'localhost'), port=int(os.getenv('REDIS_PORT', 6379)))
+        try:
+            client.ping()
+        except redis.exceptions.ConnectionError:
+            pytest.skip('Redis server not available')
+        key = f'test:rate_limit:{os.getpid()}:{time.time_ns()}'
+        yield client, key
+        client.delete(key)
+
+    def test_rate_limit_counts_atomically(self, live_redis):
+        """Test the script increments and returns the running count"""
+        client, key = live_redis
+        script = client.register_script(security._RATE_LIMIT_LUA)
+
+        assert [script(keys=[key], args=[60]) for _ in range(3)] == [1, 2, 3]
+
+    def test_rate_limit_window_starts_at_first_hit(self, live_redis):
+        """Test only the first hit sets the expiry, so the window is fixed"""
+        client, key = live_redis
+        script = client.register_script(security._RATE_LIMIT_LUA)
+
+        script(keys=[key], args=[100])
+        script(keys=[key], args=[5])
+
+        assert client.ttl(key) > 5
+
+    def test_login_attempts_refresh_lockout(self, live_redis):
+        """Test every failed login extends the lockout expiry"""
+        client, key = live_redis
+        script = client.register_script(security._LOGIN_ATTEMPT_LUA)
+
+        script(keys=[key], args=[100])
+        assert script(keys=[key], args=[5]) == 2
+        assert client.ttl(key) <= 5